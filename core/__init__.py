@@ -44,10 +44,10 @@ class SphotaEngine:
     into a unified production-ready engine.
     """
     
-    def __init__(self, weights: dict = None):
+    def __init__(self, weights: dict = None, use_fast_memory: bool = True):
         """Initialize Sphota Engine with optional custom weights."""
         self.context_engine = ContextResolutionEngine(weights=weights)
-        self.intent_engine = IntentEngine()
+        self.intent_engine = IntentEngine(use_fast_memory=use_fast_memory)
         self.normalizer = NormalizationLayer()
         self.context_manager = ContextManager()
     
@@ -3,9 +3,60 @@ Context Manager for Sphota Engine
 Implements the 12-Factor Context Resolution Matrix for dynamic intent scoring.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+import numpy as np
+from numpy.typing import NDArray
+
+from core.context_manager_jit import (
+    confidence_batch_kernel,
+    NUM_FACTORS,
+)
+
+
+# Factor 2 conflict policy as id tables: intent types and system states are
+# interned into small ids (0 = unknown, never conflicts) and an intent
+# conflicts when its id equals the state's (activate while on, etc.)
+_ACTION_ID: Dict[str, int] = {
+    'turn_on': 1, 'enable': 1, 'start': 1,
+    'turn_off': 2, 'disable': 2, 'stop': 2,
+}
+_STATE_ID: Dict[str, int] = {
+    'ON': 1, 'ENABLED': 1, 'RUNNING': 1,
+    'OFF': 2, 'DISABLED': 2, 'STOPPED': 2,
+}
+
+# Factor 5 intent types each syntax cue agrees with
+_QUESTION_TYPES = frozenset({'question', 'query', 'ask'})
+_IMPERATIVE_TYPES = frozenset({'command', 'action'})
+_POLITE_WORDS = ('please', 'could', 'would', 'kindly')
+
+# Factor 7 penalties keyed on (social mode, intent register), both lowercased
+_PROPRIETY_PENALTY: Dict[Tuple[str, str], float] = {
+    ('business', 'slang'): 0.5,   # 50% penalty
+    ('casual', 'formal'): 0.8,    # Slight penalty
+}
+
+# Factor 10 vocabulary levels each demographic prefers
+_PROFILE_VOCABULARY: Dict[str, FrozenSet[str]] = {
+    'Gen Z': frozenset({'Casual', 'Slang', 'Tech'}),
+    'Millennial': frozenset({'Neutral', 'Tech', 'Professional'}),
+    'Boomer': frozenset({'Formal', 'Traditional'}),
+    'Gen X': frozenset({'Formal', 'Traditional'}),
+}
+
+# Factor 11 pitch and urgency classes
+_RAISED_PITCH = frozenset({'High', 'Rising'})
+_URGENT = frozenset({'Urgent', 'High'})
+_PITCH_QUESTION_TYPES = frozenset({'question', 'query'})
+_LOW_PITCH_TYPES = frozenset({'statement', 'command'})
+
+# Factor 12 register classes
+_FLEXIBLE_REGISTERS = frozenset({'Slang', 'Casual'})
+_PRECISE_REGISTERS = frozenset({'Formal', 'Technical'})
+
 
 class ContextManager:
     """
@@ -28,8 +79,19 @@ class ContextManager:
     
     def __init__(self) -> None:
         """Initialize the Context Manager."""
-        self.command_history: List[str] = []
-        self.max_history_length: int = 10
+        # Bounded deque: appends past max_history_length drop the oldest entry
+        self.command_history: "deque[str]" = deque(maxlen=10)
+    
+    @property
+    def max_history_length(self) -> int:
+        """Number of commands the history buffer retains."""
+        return self.command_history.maxlen
+    
+    @max_history_length.setter
+    def max_history_length(self, length: int) -> None:
+        # A deque's maxlen is fixed, so resize by rebuilding it; shrinking
+        # keeps the newest commands
+        self.command_history = deque(self.command_history, maxlen=length)
     
     def calculate_confidence(
         self,
@@ -64,12 +126,80 @@ class ContextManager:
         Returns:
             Final confidence score after applying all 12 factors
         """
-        final_score: float = base_score
+        (association, conflict, goal, app_state, syntax, word_capacity,
+         propriety, location, time, user_profile, intonation,
+         fidelity) = self._factor_adjustments(intent, context_data)
         
-        # Factor 6: WordPower (Word Capacity) - Baseline
-        # This is the base_score from SBERT, already applied
-        word_capacity: float = base_score
+        # Factors apply in order, so additive and multiplicative steps interleave
+        # (Conflict, Propriety and Distortion scale; the rest add)
+        final_score: float = (
+            (((base_score + association) * conflict + goal + app_state + syntax + word_capacity)
+             * propriety + location + time + user_profile + intonation)
+            * fidelity
+        )
         
+        # Ensure score stays within valid bounds [0, 1]
+        final_score = max(0.0, min(1.0, final_score))
+        
+        return final_score
+    
+    def calculate_confidence_batch(
+        self,
+        intents: Sequence[Dict[str, Any]],
+        contexts: Sequence[Dict[str, Any]],
+        base_scores: Union[Sequence[float], NDArray[np.float64]]
+    ) -> NDArray[np.float64]:
+        """
+        Calculate confidence scores for N (intent, context) pairs at once.
+        
+        Produces the same scores as calling calculate_confidence per pair. The
+        factor checks still run per pair, but their adjustments are stacked
+        into an (N, 12) array and applied by a single kernel call (compiled
+        with numba when available, NumPy otherwise).
+        
+        Args:
+            intents: N intent dictionaries (same format as calculate_confidence)
+            contexts: N context dictionaries, paired with intents by position
+            base_scores: N initial similarity scores from SBERT
+        
+        Returns:
+            float64[N] final confidence scores bounded to [0, 1]
+        
+        Raises:
+            ValueError: If intents, contexts and base_scores differ in length
+        """
+        scores: NDArray[np.float64] = np.array(base_scores, dtype=np.float64)
+        if not len(intents) == len(contexts) == len(scores):
+            raise ValueError(
+                f"Batch length mismatch: {len(intents)} intents, "
+                f"{len(contexts)} contexts, {len(scores)} base scores"
+            )
+        
+        adjustments: NDArray[np.float64] = np.array(
+            [self._factor_adjustments(intent, context_data)
+             for intent, context_data in zip(intents, contexts)],
+            dtype=np.float64
+        ).reshape(len(scores), NUM_FACTORS)
+        
+        return confidence_batch_kernel(scores, adjustments)
+    
+    def _factor_adjustments(
+        self,
+        intent: Dict[str, Any],
+        context_data: Dict[str, Any]
+    ) -> List[float]:
+        """
+        Evaluate the 12 factors for one intent in one context.
+        
+        Args:
+            intent: Intent dictionary (see calculate_confidence)
+            context_data: Context dictionary (see calculate_confidence)
+        
+        Returns:
+            12 adjustments in factor order: multipliers for the factors in
+            MULTIPLICATIVE_FACTORS (context_manager_jit), additive boosts/penalties
+            for the rest
+        """
         # Factor 1: Association (Association History)
         # Check last 3 commands for keyword matches
         association_history: float = 0.0
@@ -77,33 +207,27 @@ class ContextManager:
         intent_keywords: List[str] = intent.get('keywords', [])
         
         if command_history and intent_keywords:
-            recent_commands: List[str] = command_history[-3:]
-            for command in recent_commands:
-                command_lower: str = command.lower()
-                for keyword in intent_keywords:
-                    if keyword.lower() in command_lower:
-                        association_history = 0.2
-                        final_score += association_history
-                        break
-                if association_history > 0:
+            # One lowercased string for the recent commands, so each keyword is
+            # a single substring search. The NUL separator keeps a keyword
+            # from matching across two commands.
+            recent_commands: str = '\0'.join(command_history[-3:]).lower()
+            for keyword in intent_keywords:
+                if keyword.lower() in recent_commands:
+                    association_history = 0.2
                     break
         
         # Factor 2: Conflict (Conflict Check)
         # Detect contradictions with system state
         conflict_check: float = 1.0
         intent_type: str = intent.get('type', '')
+        intent_kind: str = intent_type.lower() if intent_type else ''
         system_state: str = context_data.get('system_state', '')
         
-        if intent_type and system_state:
+        if intent_kind and system_state:
             # Check for contradictions
-            if (intent_type.lower() in ['turn_on', 'enable', 'start'] and 
-                system_state.upper() in ['ON', 'ENABLED', 'RUNNING']):
-                conflict_check = 0.1  # Severe penalty
-                final_score *= conflict_check
-            elif (intent_type.lower() in ['turn_off', 'disable', 'stop'] and 
-                  system_state.upper() in ['OFF', 'DISABLED', 'STOPPED']):
+            action_id: int = _ACTION_ID.get(intent_kind, 0)
+            if action_id and action_id == _STATE_ID.get(system_state.upper(), 0):
                 conflict_check = 0.1  # Severe penalty
-                final_score *= conflict_check
         
         # Factor 3: Purpose (Active Goal)
         # Boost if intent aligns with current task
@@ -114,12 +238,10 @@ class ContextManager:
         if current_task_id and intent_task_id:
             if current_task_id == intent_task_id:
                 active_goal = 0.15
-                final_score += active_goal
             else:
                 # Check for related tasks
                 if str(current_task_id) in str(intent_task_id) or str(intent_task_id) in str(current_task_id):
                     active_goal = 0.08
-                    final_score += active_goal
         
         # Factor 4: Situation (Application State)
         # Boost if intent is valid for current screen/menu
@@ -130,11 +252,9 @@ class ContextManager:
         if current_screen and valid_screens:
             if current_screen in valid_screens:
                 app_state = 0.12
-                final_score += app_state
             else:
                 # Slight penalty for wrong screen
                 app_state = -0.05
-                final_score += app_state
         
         # Factor 5: Indicator (Syntax Cues)
         # Boost based on grammatical markers
@@ -143,18 +263,15 @@ class ContextManager:
         
         if user_input:
             # Question detection
-            if '?' in user_input and intent_type.lower() in ['question', 'query', 'ask']:
+            if '?' in user_input and intent_kind in _QUESTION_TYPES:
                 syntax_cues = 0.1
-                final_score += syntax_cues
             # Imperative detection
-            elif user_input.strip().endswith('!') and intent_type.lower() in ['command', 'action']:
+            elif user_input.strip().endswith('!') and intent_kind in _IMPERATIVE_TYPES:
                 syntax_cues = 0.08
-                final_score += syntax_cues
             # Polite form detection
-            elif any(word in user_input.lower() for word in ['please', 'could', 'would', 'kindly']):
+            elif any(word in user_input.lower() for word in _POLITE_WORDS):
                 if intent.get('politeness', '') == 'formal':
                     syntax_cues = 0.06
-                    final_score += syntax_cues
         
         # Factor 7: Propriety (Propriety)
         # Adjust based on social context
@@ -162,17 +279,15 @@ class ContextManager:
         social_mode: str = context_data.get('social_mode', '')
         intent_register: str = intent.get('register', '')
         
-        if social_mode.lower() == 'business' and intent_register.lower() == 'slang':
-            propriety = 0.5  # 50% penalty
-            final_score *= propriety
-        elif social_mode.lower() == 'casual' and intent_register.lower() == 'formal':
-            propriety = 0.8  # Slight penalty
-            final_score *= propriety
+        mode: str = social_mode.lower()
+        register: str = intent_register.lower()
+        
+        if (mode, register) in _PROPRIETY_PENALTY:
+            propriety = _PROPRIETY_PENALTY[(mode, register)]
         elif social_mode and intent_register:
             # Register matches social mode
-            if intent_register.lower() in ['neutral', social_mode.lower()]:
+            if register == 'neutral' or register == mode:
                 propriety = 1.1  # Slight boost
-                final_score *= propriety
         
         # Factor 8: Location (Location)
         # Boost if location matches
@@ -183,15 +298,12 @@ class ContextManager:
         if required_location:
             if gps_tag and gps_tag.lower() == required_location.lower():
                 location = 0.2
-                final_score += location
             elif not gps_tag:
                 # No location data, apply neutral penalty
                 location = -0.05
-                final_score += location
             else:
                 # Wrong location
                 location = -0.15
-                final_score += location
         
         # Factor 9: Time (Time)
         # Boost if time matches valid range
@@ -206,11 +318,9 @@ class ContextManager:
             start_hour, end_hour = valid_time_range
             if start_hour <= current_hour <= end_hour:
                 time = 0.15
-                final_score += time
             else:
                 # Time mismatch penalty
                 time = -0.1
-                final_score += time
         
         # Factor 10: UserProfile (User Profile)
         # Boost if vocabulary matches user demographic
@@ -219,22 +329,12 @@ class ContextManager:
         vocabulary_level: str = intent.get('vocabulary_level', '')
         
         if user_demographic and vocabulary_level:
-            # Gen Z preferences
-            if user_demographic == 'Gen Z' and vocabulary_level in ['Casual', 'Slang', 'Tech']:
-                user_profile = 0.12
-                final_score += user_profile
-            # Millennial preferences
-            elif user_demographic == 'Millennial' and vocabulary_level in ['Neutral', 'Tech', 'Professional']:
-                user_profile = 0.12
-                final_score += user_profile
-            # Boomer preferences
-            elif user_demographic in ['Boomer', 'Gen X'] and vocabulary_level in ['Formal', 'Traditional']:
+            # Vocabulary the demographic prefers
+            if vocabulary_level in _PROFILE_VOCABULARY.get(user_demographic, ()):
                 user_profile = 0.12
-                final_score += user_profile
             else:
                 # Mismatch
                 user_profile = -0.05
-                final_score += user_profile
         
         # Factor 11: Intonation (Intonation)
         # Boost based on audio pitch analysis
@@ -243,19 +343,16 @@ class ContextManager:
         intent_urgency: str = intent.get('urgency', '')
         
         if audio_pitch:
-            if audio_pitch in ['High', 'Rising'] and intent_urgency in ['Urgent', 'High']:
+            raised: bool = audio_pitch in _RAISED_PITCH
+            if raised and intent_urgency in _URGENT:
                 intonation = 0.15
-                final_score += intonation
-            elif audio_pitch in ['High', 'Rising'] and intent_type.lower() in ['question', 'query']:
+            elif raised and intent_kind in _PITCH_QUESTION_TYPES:
                 intonation = 0.12
-                final_score += intonation
-            elif audio_pitch == 'Low' and intent_type.lower() in ['statement', 'command']:
+            elif audio_pitch == 'Low' and intent_kind in _LOW_PITCH_TYPES:
                 intonation = 0.08
-                final_score += intonation
-            elif audio_pitch in ['High', 'Rising'] and intent_urgency == 'Low':
+            elif raised and intent_urgency == 'Low':
                 # Pitch-urgency mismatch
                 intonation = -0.05
-                final_score += intonation
         
         # Factor 12: Distortion (Fidelity)
         # Widen search threshold for low-confidence input
@@ -264,23 +361,22 @@ class ContextManager:
         
         if input_confidence < 0.7:
             # Low input quality - check if intent has slang/alternate forms
-            if intent_register in ['Slang', 'Casual'] or intent.get('has_alternate_forms', False):
+            if intent_register in _FLEXIBLE_REGISTERS or intent.get('has_alternate_forms', False):
                 fidelity = 1.15  # Boost slang/flexible intents
-                final_score *= fidelity
             else:
                 # Strict intents get penalty with low input quality
                 fidelity = 0.85
-                final_score *= fidelity
         elif input_confidence >= 0.9:
             # High quality input - boost formal/precise intents
-            if intent_register in ['Formal', 'Technical']:
+            if intent_register in _PRECISE_REGISTERS:
                 fidelity = 1.1
-                final_score *= fidelity
-        
-        # Ensure score stays within valid bounds [0, 1]
-        final_score = max(0.0, min(1.0, final_score))
         
-        return final_score
+        # Factor 6: WordPower (Word Capacity) is the base score itself
+        return [
+            association_history, conflict_check, active_goal, app_state,
+            syntax_cues, 0.0, propriety, location,
+            time, user_profile, intonation, fidelity,
+        ]
     
     def update_command_history(self, command: str) -> None:
         """
@@ -290,10 +386,17 @@ class ContextManager:
             command: New command to add to history
         """
         self.command_history.append(command)
+    
+    def extend_command_history(self, commands: Iterable[str]) -> None:
+        """
+        Add several commands to the history buffer, oldest first.
         
-        # Maintain max history length
-        if len(self.command_history) > self.max_history_length:
-            self.command_history.pop(0)
+        Only the newest max_history_length commands are retained.
+        
+        Args:
+            commands: Commands to add, in the order they were issued
+        """
+        self.command_history.extend(commands)
     
     def get_command_history(self) -> List[str]:
         """
@@ -302,7 +405,7 @@ class ContextManager:
         Returns:
             List of recent commands
         """
-        return self.command_history.copy()
+        return list(self.command_history)
     
     def clear_command_history(self) -> None:
         """Clear the command history buffer."""
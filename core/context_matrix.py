@@ -14,12 +14,13 @@ from datetime import datetime
 import numpy as np
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextObject:
     """
     Container for the 12 contextual factors used in intent resolution.
     
     Each field corresponds to one of the linguistic determinants.
+    Instances are immutable; use dataclasses.replace() to derive a variant.
     """
     # Historical/Associative factors
     history: Optional[List[str]] = None  # Association/User history
@@ -480,7 +481,7 @@ class ContextResolutionMatrix:
         Returns:
             List of active factor names
         """
-        active = []
+        active: List[str] = []
         if context.history:
             active.append("history")
         if context.conflict:
@@ -19,7 +19,79 @@ The 12 factors (in English):
 12. Distortion (input fidelity normalization)
 """
 
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from core.context_weighter_jit import (
+    apply_weights_kernel,
+    apply_weights_batch_kernel,
+    scratch_flags,
+    NUM_FACTORS,
+    ASSOCIATION, OPPOSITION, PURPOSE, SITUATION, INDICATOR, WORD_CAPACITY,
+    PROPRIETY, PLACE, TIME, INDIVIDUAL, INTONATION, DISTORTION,
+    NO_EFFECT, MATCH, PARTIAL_MATCH, MISMATCH,
+    PROPRIETY_BLOCK, PROPRIETY_TOO_FORMAL, PROPRIETY_MATCH, PLACE_UNKNOWN,
+)
+
+
+# Factor 2 opposition policy as an integer lookup table. Actions and
+# states are interned into small ids (0 = unknown, never conflicts) and
+# _OPPOSITION[action_id][state_id] holds the factor's outcome code.
+_ACTION_ID: Dict[str, int] = {
+    'turn_on': 1, 'enable': 1, 'start': 1, 'activate': 1,
+    'turn_off': 2, 'disable': 2, 'stop': 2, 'deactivate': 2,
+}
+_STATE_ID: Dict[str, int] = {
+    'ON': 1, 'ENABLED': 1, 'RUNNING': 1, 'ACTIVE': 1,
+    'OFF': 2, 'DISABLED': 2, 'STOPPED': 2, 'INACTIVE': 2,
+}
+_OPPOSITION: Tuple[Tuple[int, ...], ...] = (
+    # state:  unknown    on         off
+    (NO_EFFECT, NO_EFFECT, NO_EFFECT),  # unknown action
+    (NO_EFFECT, MATCH, NO_EFFECT),      # activating action while already on
+    (NO_EFFECT, NO_EFFECT, MATCH),      # deactivating action while already off
+)
+
+
+# Factor 5 syntax cues as bits. A context's syntax_flags fold into one
+# mask, each intent type maps to the cue bit it agrees with, and the
+# factor matches when the two overlap.
+_SYNTAX_QUESTION = 1 << 0
+_SYNTAX_EXCLAMATION = 1 << 1
+_SYNTAX_STATEMENT = 1 << 2
+
+_SYNTAX_BIT: Dict[str, int] = {
+    'question': _SYNTAX_QUESTION,
+    'exclamation': _SYNTAX_EXCLAMATION,
+    'statement': _SYNTAX_STATEMENT,
+}
+_INTENT_TYPE_SYNTAX_BIT: Dict[str, int] = {
+    'query': _SYNTAX_QUESTION, 'ask': _SYNTAX_QUESTION, 'question': _SYNTAX_QUESTION,
+    'command': _SYNTAX_EXCLAMATION, 'action': _SYNTAX_EXCLAMATION, 'imperative': _SYNTAX_EXCLAMATION,
+    'statement': _SYNTAX_STATEMENT, 'information': _SYNTAX_STATEMENT,
+}
+
+
+@lru_cache(maxsize=256)
+def _syntax_mask(syntax_flags: Tuple[str, ...]) -> int:
+    """Bitmask of the syntax cues present in syntax_flags, cached per tuple."""
+    mask = 0
+    for flag in syntax_flags:
+        mask |= _SYNTAX_BIT.get(flag.lower(), 0)
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def _lowered_set(items: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased frozenset of tags/history items, cached per tuple."""
+    return frozenset(item.lower() for item in items)
+
+
+def _freeze(value: Any) -> Any:
+    """Make a list-valued intent field hashable for projection keys."""
+    return tuple(value) if isinstance(value, list) else value
 
 
 class ContextWeighter:
@@ -30,6 +102,22 @@ class ContextWeighter:
     Final score is always bounded to [0.0, 1.0].
     """
     
+    # Intent keys read by each factor's *_code method. The batch path
+    # evaluates a factor once per distinct projection of the intents onto
+    # these keys and gathers the codes back out to every intent.
+    _FACTOR_INTENT_KEYS: Tuple[Tuple[int, str, Tuple[str, ...]], ...] = (
+        (ASSOCIATION, '_association_code', ('tags',)),
+        (OPPOSITION, '_opposition_code', ('action',)),
+        (PURPOSE, '_purpose_code', ('goal_alignment',)),
+        (SITUATION, '_situation_code', ('valid_screens',)),
+        (INDICATOR, '_indicator_code', ('type',)),
+        (PROPRIETY, '_propriety_code', ('formality', 'contains_slang')),
+        (PLACE, '_place_code', ('required_location',)),
+        (TIME, '_time_code', ('time_specific',)),
+        (INDIVIDUAL, '_individual_code', ('vocabulary_level',)),
+        (INTONATION, '_intonation_code', ('type',)),
+    )
+    
     def __init__(self) -> None:
         """Initialize the context weighter with default factor weights."""
         self.factor_weights: Dict[str, float] = {
@@ -55,8 +143,12 @@ class ContextWeighter:
         """
         Apply 12-factor weighting to the intent confidence score.
         
-        Sequentially applies all 12 factors, each modifying the score based on
-        contextual information. Final score is bounded to [0.0, 1.0].
+        Each factor is reduced to a small outcome code on the Python side;
+        the codes are then applied in factor order by the compiled kernel in
+        core.context_weighter_jit. Final score is bounded to [0.0, 1.0].
+        
+        Factor 12 (Distortion): if input_fidelity < 0.5 (noisy), the score
+        is scaled by (0.5 + input_fidelity).
         
         Args:
             intent: Dictionary containing intent metadata with keys like:
@@ -88,59 +180,42 @@ class ContextWeighter:
         Returns:
             float: Final confidence score bounded to [0.0, 1.0]
         """
-        base_score: float = context.get('base_score', 0.5)
-        final_score: float = base_score
-        
-        # ===== APPLY ALL 12 FACTORS =====
-        
-        # Factor 1: Association (User History)
-        final_score = self._apply_association(final_score, intent, context)
-        
-        # Factor 2: Opposition (Conflict Detection)
-        final_score = self._apply_opposition(final_score, intent, context)
+        # Factor 7 veto: slang in business mode is blocked outright, so
+        # none of the other factors need evaluating
+        if intent.get('contains_slang', False):
+            social_mode: str = context.get('social_mode', '')
+            if social_mode and social_mode.lower() == 'business':
+                return 0.0
         
-        # Factor 3: Purpose (Goal Alignment)
-        final_score = self._apply_purpose(final_score, intent, context)
-        
-        # Factor 4: Situation (Screen State)
-        final_score = self._apply_situation(final_score, intent, context)
-        
-        # Factor 5: Indicator (Syntax Cues)
-        final_score = self._apply_indicator(final_score, intent, context)
-        
-        # Factor 6: Word Capacity (Base Score)
-        # Already incorporated in base_score
-        
-        # Factor 7: Propriety (Social Mode)
-        final_score = self._apply_propriety(final_score, intent, context)
-        
-        # Factor 8: Place (Location Context)
-        final_score = self._apply_place(final_score, intent, context)
-        
-        # Factor 9: Time (Temporal Context)
-        final_score = self._apply_time(final_score, intent, context)
-        
-        # Factor 10: Individual (User Profile)
-        final_score = self._apply_individual(final_score, intent, context)
-        
-        # Factor 11: Intonation (Audio Features)
-        final_score = self._apply_intonation(final_score, intent, context)
-        
-        # Factor 12: Distortion (Input Fidelity)
-        final_score = self._apply_distortion(final_score, intent, context)
-        
-        # ===== FINALIZE SCORE =====
-        # Ensure score is within valid bounds [0.0, 1.0]
-        final_score = max(0.0, min(1.0, final_score))
+        base_score: float = context.get('base_score', 0.5)
+        input_fidelity: float = context.get('input_fidelity', 1.0)
         
-        return final_score
+        # ===== REDUCE ALL 12 FACTORS TO OUTCOME CODES =====
+        # Each factor rule lives only in its *_code method, which
+        # apply_weights_batch projects over intent tables too
+        flags = scratch_flags()
+        
+        flags[ASSOCIATION] = self._association_code(intent, context)    # Factor 1
+        flags[OPPOSITION] = self._opposition_code(intent, context)      # Factor 2
+        flags[PURPOSE] = self._purpose_code(intent, context)            # Factor 3
+        flags[SITUATION] = self._situation_code(intent, context)        # Factor 4
+        flags[INDICATOR] = self._indicator_code(intent, context)        # Factor 5
+        flags[WORD_CAPACITY] = NO_EFFECT                                # Factor 6: in base_score
+        flags[PROPRIETY] = self._propriety_code(intent, context)        # Factor 7
+        flags[PLACE] = self._place_code(intent, context)                # Factor 8
+        flags[TIME] = self._time_code(intent, context)                  # Factor 9
+        flags[INDIVIDUAL] = self._individual_code(intent, context)      # Factor 10
+        flags[INTONATION] = self._intonation_code(intent, context)      # Factor 11
+        flags[DISTORTION] = MATCH if input_fidelity < 0.5 else NO_EFFECT  # Factor 12
+        
+        # ===== SCORE AND BOUND TO [0.0, 1.0] =====
+        return float(apply_weights_kernel(base_score, flags, input_fidelity))
     
-    def _apply_association(
+    def _association_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 1: Association (User History)
         
@@ -148,34 +223,36 @@ class ContextWeighter:
         a tag in history, boost score by +0.15.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH on a history hit, otherwise NO_EFFECT
         """
         user_history: List[str] = context.get('user_history', [])
         intent_tags: List[str] = intent.get('tags', [])
         
         if user_history and intent_tags:
-            recent_history: List[str] = user_history[-3:]
+            tags: FrozenSet[str] = _lowered_set(tuple(intent_tags))
+            recent_history: FrozenSet[str] = _lowered_set(tuple(user_history[-3:]))
             
-            for tag in intent_tags:
-                tag_lower: str = tag.lower()
+            # Exact tag hits are a single set operation
+            if not tags.isdisjoint(recent_history):
+                return MATCH
+            
+            # Otherwise a tag may still appear inside a longer history item
+            for tag in tags:
                 for history_item in recent_history:
-                    if tag_lower in history_item.lower():
-                        score += 0.15
-                        return score
+                    if tag in history_item:
+                        return MATCH
         
-        return score
+        return NO_EFFECT
     
-    def _apply_opposition(
+    def _opposition_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 2: Opposition (Conflict Detection)
         
@@ -183,41 +260,29 @@ class ContextWeighter:
         (e.g., "Turn On" when state="ON"), multiply score by 0.1 (severe penalty).
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH when the intent contradicts the state, otherwise NO_EFFECT
         """
         system_state: str = context.get('system_state', '')
         intent_action: str = intent.get('action', '')
         
         if not intent_action or not system_state:
-            return score
+            return NO_EFFECT
         
-        intent_action_lower: str = intent_action.lower()
-        system_state_upper: str = system_state.upper()
+        # Contradiction (severe penalty) is a single table lookup
+        action_id: int = _ACTION_ID.get(intent_action.lower(), 0)
+        state_id: int = _STATE_ID.get(system_state.upper(), 0)
         
-        # Check for contradictions
-        if intent_action_lower in ['turn_on', 'enable', 'start', 'activate']:
-            if system_state_upper in ['ON', 'ENABLED', 'RUNNING', 'ACTIVE']:
-                score *= 0.1  # Severe penalty
-                return score
-        
-        if intent_action_lower in ['turn_off', 'disable', 'stop', 'deactivate']:
-            if system_state_upper in ['OFF', 'DISABLED', 'STOPPED', 'INACTIVE']:
-                score *= 0.1  # Severe penalty
-                return score
-        
-        return score
+        return _OPPOSITION[action_id][state_id]
     
-    def _apply_purpose(
+    def _purpose_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 3: Purpose (Goal Alignment)
         
@@ -225,37 +290,35 @@ class ContextWeighter:
         (e.g., goal="booking_flight"), boost by +0.20.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH (+0.20), PARTIAL_MATCH (+0.10) or NO_EFFECT
         """
         active_goal: str = context.get('active_goal', '')
         intent_goal_alignment: str = intent.get('goal_alignment', '')
         
         if not active_goal or not intent_goal_alignment:
-            return score
+            return NO_EFFECT
         
         active_goal_lower: str = active_goal.lower()
         intent_goal_lower: str = intent_goal_alignment.lower()
         
         # Exact match
         if active_goal_lower == intent_goal_lower:
-            score += 0.20
+            return MATCH
         # Partial match
         elif intent_goal_lower in active_goal_lower or active_goal_lower in intent_goal_lower:
-            score += 0.10
+            return PARTIAL_MATCH
         
-        return score
+        return NO_EFFECT
     
-    def _apply_situation(
+    def _situation_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 4: Situation (Screen State)
         
@@ -263,30 +326,28 @@ class ContextWeighter:
         current screen, boost by +0.15.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH (+0.15), MISMATCH (-0.05) or NO_EFFECT
         """
         current_screen: str = context.get('current_screen', '')
         valid_screens: List[str] = intent.get('valid_screens', [])
         
         if current_screen and valid_screens:
             if current_screen in valid_screens:
-                score += 0.15
+                return MATCH
             else:
-                score -= 0.05  # Slight penalty if intent not valid on screen
+                return MISMATCH  # Slight penalty if intent not valid on screen
         
-        return score
+        return NO_EFFECT
     
-    def _apply_indicator(
+    def _indicator_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 5: Indicator (Syntax Cues)
         
@@ -294,85 +355,73 @@ class ContextWeighter:
         intent is "Query", boost by +0.08.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH when the syntax agrees with the intent type, otherwise NO_EFFECT
         """
         syntax_flags: List[str] = context.get('syntax_flags', [])
         intent_type: str = intent.get('type', '')
         
         if not syntax_flags or not intent_type:
-            return score
-        
-        syntax_flags_lower: List[str] = [s.lower() for s in syntax_flags]
-        intent_type_lower: str = intent_type.lower()
-        
-        # Question syntax matches query intent
-        if 'question' in syntax_flags_lower and intent_type_lower in ['query', 'ask', 'question']:
-            score += 0.08
-        
-        # Exclamation syntax matches command intent
-        elif 'exclamation' in syntax_flags_lower and intent_type_lower in ['command', 'action', 'imperative']:
-            score += 0.08
+            return NO_EFFECT
         
-        # Statement syntax matches informational intent
-        elif 'statement' in syntax_flags_lower and intent_type_lower in ['statement', 'information']:
-            score += 0.08
+        # Question syntax matches query intents, exclamation matches
+        # commands, statement matches informational intents
+        if _syntax_mask(tuple(syntax_flags)) & _INTENT_TYPE_SYNTAX_BIT.get(intent_type.lower(), 0):
+            return MATCH
         
-        return score
+        return NO_EFFECT
     
-    def _apply_propriety(
+    def _propriety_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 7: Propriety (Social Mode)
         
         Logic: Check social_mode. If "Business" and intent contains
-        "Slang/Vulgar", multiply score by 0.0 (block it).
+        "Slang/Vulgar", block it: the final score is 0.0 regardless of
+        every other factor.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            PROPRIETY_BLOCK (x0.0), PROPRIETY_TOO_FORMAL (x0.8),
+            PROPRIETY_MATCH (x1.1) or NO_EFFECT
         """
         social_mode: str = context.get('social_mode', '')
         intent_formality: str = intent.get('formality', 'neutral')
         contains_slang: bool = intent.get('contains_slang', False)
         
         if not social_mode:
-            return score
+            return NO_EFFECT
         
         social_mode_lower: str = social_mode.lower()
         
         # Block vulgar/slang content in business mode
         if social_mode_lower == 'business' and contains_slang:
-            score *= 0.0
+            return PROPRIETY_BLOCK
         
         # Penalize formal intent in casual mode
         elif social_mode_lower == 'casual' and intent_formality == 'formal':
-            score *= 0.8
+            return PROPRIETY_TOO_FORMAL
         
         # Boost matching formality levels
         elif social_mode_lower == intent_formality.lower() or intent_formality == 'neutral':
-            score *= 1.1
+            return PROPRIETY_MATCH
         
-        return score
+        return NO_EFFECT
     
-    def _apply_place(
+    def _place_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 8: Place (Location Context)
         
@@ -380,39 +429,33 @@ class ContextWeighter:
         (e.g., "Kitchen") and we are there, boost by +0.18.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH (+0.18), MISMATCH (-0.15), PLACE_UNKNOWN (-0.05) or NO_EFFECT
         """
         current_location: str = context.get('location', '')
         required_location: str = intent.get('required_location', '')
         
         if not required_location:
-            return score
-        
-        required_location_lower: str = required_location.lower()
+            return NO_EFFECT
         
         # Location matches
         if current_location:
-            if current_location.lower() == required_location_lower:
-                score += 0.18
+            if current_location.lower() == required_location.lower():
+                return MATCH
             else:
-                score -= 0.15  # Wrong location penalty
-        else:
-            # No location data available
-            score -= 0.05
+                return MISMATCH  # Wrong location penalty
         
-        return score
+        # No location data available
+        return PLACE_UNKNOWN
     
-    def _apply_time(
+    def _time_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 9: Time (Temporal Context)
         
@@ -420,39 +463,36 @@ class ContextWeighter:
         (e.g., "Good Morning"), boost by +0.15 only if time matches.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH (+0.15), MISMATCH (-0.05) or NO_EFFECT
         """
         time_of_day: str = context.get('time_of_day', '')
         required_time: str = intent.get('time_specific', '')
         
         if not required_time:
-            return score
+            return NO_EFFECT
         
         required_time_lower: str = required_time.lower()
         
         # Time matches
         if time_of_day:
             if time_of_day.lower() == required_time_lower:
-                score += 0.15
+                return MATCH
             elif required_time_lower not in time_of_day.lower():
-                score -= 0.05  # Wrong time penalty
-        else:
-            # No time data available
-            score -= 0.05
+                return MISMATCH  # Wrong time penalty
+            return NO_EFFECT
         
-        return score
+        # No time data available
+        return MISMATCH
     
-    def _apply_individual(
+    def _individual_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 10: Individual (User Profile)
         
@@ -460,42 +500,37 @@ class ContextWeighter:
         demographic (e.g., "Gen Z"), boost by +0.12.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH (+0.12), PARTIAL_MATCH (+0.06) or NO_EFFECT
         """
         user_profile: str = context.get('user_profile', '')
         intent_vocab_level: str = intent.get('vocabulary_level', 'neutral')
         
         if not user_profile or not intent_vocab_level:
-            return score
+            return NO_EFFECT
         
         user_profile_lower: str = user_profile.lower()
         intent_vocab_lower: str = intent_vocab_level.lower()
         
         # Exact match
         if user_profile_lower == intent_vocab_lower:
-            score += 0.12
+            return MATCH
         
-        # Partial match
-        elif user_profile_lower in intent_vocab_lower or intent_vocab_lower in user_profile_lower:
-            score += 0.06
-        
-        # Neutral vocabulary works for all profiles
-        elif intent_vocab_lower == 'neutral':
-            score += 0.06
+        # Partial match, or neutral vocabulary that works for all profiles
+        elif (user_profile_lower in intent_vocab_lower or intent_vocab_lower in user_profile_lower
+              or intent_vocab_lower == 'neutral'):
+            return PARTIAL_MATCH
         
-        return score
+        return NO_EFFECT
     
-    def _apply_intonation(
+    def _intonation_code(
         self, 
-        score: float, 
         intent: Dict[str, Any], 
         context: Dict[str, Any]
-    ) -> float:
+    ) -> int:
         """
         Factor 11: Intonation (Audio Features)
         
@@ -503,71 +538,114 @@ class ContextWeighter:
         vs "Flat" (Statement), boost corresponding intent types by +0.08.
         
         Args:
-            score: Current confidence score
             intent: Intent metadata
             context: Context information
             
         Returns:
-            Modified confidence score
+            MATCH when the pitch agrees with the intent type, otherwise NO_EFFECT
         """
         audio_features: Dict[str, str] = context.get('audio_features', {})
         pitch: str = audio_features.get('pitch', '')
         intent_type: str = intent.get('type', '')
         
         if not pitch or not intent_type:
-            return score
+            return NO_EFFECT
         
         pitch_lower: str = pitch.lower()
         intent_type_lower: str = intent_type.lower()
         
         # Rising pitch (question intonation) matches query intents
         if pitch_lower == 'rising' and intent_type_lower in ['question', 'query', 'ask']:
-            score += 0.08
+            return MATCH
         
         # Flat pitch (statement intonation) matches command/statement intents
         elif pitch_lower == 'flat' and intent_type_lower in ['statement', 'command', 'action']:
-            score += 0.08
+            return MATCH
         
-        return score
+        return NO_EFFECT
     
-    def _apply_distortion(
-        self, 
-        score: float, 
-        intent: Dict[str, Any], 
-        context: Dict[str, Any]
-    ) -> float:
+    def build_intent_table(self, intents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Factor 12: Distortion (Input Fidelity)
+        Precompute a columnar table of intents for apply_weights_batch.
         
-        Logic: Check input_fidelity. If fidelity < 0.5 (noisy),
-        trigger the normalization layer to map slang to pure intent before scoring.
+        Build this once when the intent corpus is loaded. For every factor
+        the intents are grouped by the metadata that factor reads, so that
+        scoring a context only evaluates each distinct value once.
         
         Args:
-            score: Current confidence score
-            intent: Intent metadata
-            context: Context information
+            intents: Intent metadata dictionaries (same format as apply_weights)
             
         Returns:
-            Modified confidence score
+            Dict with 'size', 'ids' (intent ids in input order) and 'factors',
+            a list of (slot, method_name, projections, index) where index is
+            an int32[N] array into projections
         """
+        size: int = len(intents)
+        factors: List[Tuple[int, str, List[Dict[str, Any]], np.ndarray]] = []
+        
+        for slot, method_name, keys in self._FACTOR_INTENT_KEYS:
+            seen: Dict[Tuple[Any, ...], int] = {}
+            projections: List[Dict[str, Any]] = []
+            index: np.ndarray = np.empty(size, dtype=np.int32)
+            
+            for row, intent in enumerate(intents):
+                key = tuple((k, _freeze(intent[k])) for k in keys if k in intent)
+                position = seen.get(key)
+                if position is None:
+                    position = seen[key] = len(projections)
+                    projections.append(dict(key))
+                index[row] = position
+            
+            factors.append((slot, method_name, projections, index))
+        
+        return {
+            'size': size,
+            'ids': [intent.get('id') for intent in intents],
+            'factors': factors
+        }
+    
+    def apply_weights_batch(
+        self,
+        intent_table: Dict[str, Any],
+        context: Dict[str, Any],
+        base_scores: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Apply 12-factor weighting to every intent in a prebuilt table at once.
+        
+        Produces the same scores as calling apply_weights per intent, but the
+        factor arithmetic runs as a handful of NumPy vector operations.
+        
+        Args:
+            intent_table: Table returned by build_intent_table
+            context: Context information (same format as apply_weights)
+            base_scores: Optional float[N] per-intent semantic scores; defaults
+                to context['base_score'] for every intent
+        
+        Returns:
+            np.ndarray: float64[N] final scores bounded to [0.0, 1.0]
+        """
+        size: int = intent_table['size']
         input_fidelity: float = context.get('input_fidelity', 1.0)
         
-        # If input quality is poor (< 0.5), apply normalization
+        if base_scores is None:
+            base_scores = np.full(size, context.get('base_score', 0.5), dtype=np.float64)
+        
+        flags: np.ndarray = np.zeros((NUM_FACTORS, size), dtype=np.int8)
+        
+        for slot, method_name, projections, index in intent_table['factors']:
+            code = getattr(self, method_name)
+            codes: np.ndarray = np.fromiter(
+                (code(projection, context) for projection in projections),
+                dtype=np.int8,
+                count=len(projections)
+            )
+            flags[slot] = codes[index]
+        
         if input_fidelity < 0.5:
-            try:
-                # Import normalization layer for handling distorted input
-                from core.normalization_layer import NormalizationLayer
-                
-                normalizer: NormalizationLayer = NormalizationLayer()
-                # Apply normalization to map slang/distorted forms to pure intent
-                # Reduce score confidence based on input quality
-                score *= (0.5 + input_fidelity)
-                
-            except ImportError:
-                # Fallback if normalization layer not available
-                score *= (0.5 + input_fidelity)
+            flags[DISTORTION] = MATCH
         
-        return score
+        return apply_weights_batch_kernel(base_scores, flags, input_fidelity)
     
     def calculate_final_score(
         self,
@@ -0,0 +1,209 @@
+"""
+Context Weighter Kernel - Compiled 12-Factor Score Arithmetic
+
+Holds the numeric half of ContextWeighter.apply_weights. The Python side
+reduces each factor to a small integer outcome code (string compares, tag
+matching); this kernel turns the base score plus the 12 codes into the
+final bounded score.
+
+When numba is installed the kernel is compiled with @njit(cache=True) and
+warmed up at import time. Without numba the same function runs as plain
+Python, so results are identical either way.
+"""
+
+import threading
+from typing import Any
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+# Factor slots in the flags vector (Factor N lives at index N - 1)
+ASSOCIATION = 0
+OPPOSITION = 1
+PURPOSE = 2
+SITUATION = 3
+INDICATOR = 4
+WORD_CAPACITY = 5  # Already carried by base_score, slot kept for alignment
+PROPRIETY = 6
+PLACE = 7
+TIME = 8
+INDIVIDUAL = 9
+INTONATION = 10
+DISTORTION = 11
+
+NUM_FACTORS = 12
+
+# Outcome codes shared by several factors
+NO_EFFECT = 0
+MATCH = 1
+PARTIAL_MATCH = 2
+MISMATCH = -1
+
+# Factor-specific outcome codes
+PROPRIETY_BLOCK = 1           # Slang in business mode
+PROPRIETY_TOO_FORMAL = 2      # Formal intent in casual mode
+PROPRIETY_MATCH = 3           # Formality matches (or is neutral)
+PLACE_UNKNOWN = -2            # Location required but not known
+
+
+def _apply_weights_kernel(base_score: float, flags: Any, input_fidelity: float) -> float:
+    """
+    Apply the 12 factor outcome codes to a base score.
+
+    Factors are applied in the same order as the original per-factor
+    methods so additive and multiplicative steps interleave identically.
+
+    Args:
+        base_score: Raw semantic similarity score
+        flags: Sequence of 12 int outcome codes, one per factor
+        input_fidelity: Input quality score used by Factor 12
+
+    Returns:
+        Final score bounded to [0.0, 1.0]
+    """
+    # Factor 7 veto: a propriety block zeroes the score outright
+    if flags[6] == 1:
+        return 0.0
+
+    score = base_score
+
+    # Factor 1: Association
+    if flags[0] == 1:
+        score += 0.15
+
+    # Factor 2: Opposition
+    if flags[1] == 1:
+        score *= 0.1
+
+    # Factor 3: Purpose
+    if flags[2] == 1:
+        score += 0.20
+    elif flags[2] == 2:
+        score += 0.10
+
+    # Factor 4: Situation
+    if flags[3] == 1:
+        score += 0.15
+    elif flags[3] == -1:
+        score -= 0.05
+
+    # Factor 5: Indicator
+    if flags[4] == 1:
+        score += 0.08
+
+    # Factor 6: Word Capacity is the base score itself
+
+    # Factor 7: Propriety (the block case returned above)
+    if flags[6] == 2:
+        score *= 0.8
+    elif flags[6] == 3:
+        score *= 1.1
+
+    # Factor 8: Place
+    if flags[7] == 1:
+        score += 0.18
+    elif flags[7] == -1:
+        score -= 0.15
+    elif flags[7] == -2:
+        score -= 0.05
+
+    # Factor 9: Time
+    if flags[8] == 1:
+        score += 0.15
+    elif flags[8] == -1:
+        score -= 0.05
+
+    # Factor 10: Individual
+    if flags[9] == 1:
+        score += 0.12
+    elif flags[9] == 2:
+        score += 0.06
+
+    # Factor 11: Intonation
+    if flags[10] == 1:
+        score += 0.08
+
+    # Factor 12: Distortion
+    if flags[11] == 1:
+        score *= (0.5 + input_fidelity)
+
+    return max(0.0, min(1.0, score))
+
+
+if NUMBA_AVAILABLE:
+    apply_weights_kernel = njit(cache=True)(_apply_weights_kernel)
+    # Compile once at import so the first real call doesn't pay for it
+    apply_weights_kernel(0.0, np.zeros(NUM_FACTORS, dtype=np.int8), 1.0)
+else:
+    apply_weights_kernel = _apply_weights_kernel
+
+
+def apply_weights_batch_kernel(
+    base_scores: np.ndarray,
+    flags: np.ndarray,
+    input_fidelity: float
+) -> np.ndarray:
+    """
+    Vectorized form of _apply_weights_kernel over N intents.
+
+    Each factor becomes one np.where/np.select over its row of codes. Untouched
+    intents get "+ 0.0" / "* 1.0", which leaves their scores bit-for-bit
+    equal to the scalar kernel. Propriety-blocked intents are set to 0.0
+    at the end, matching the scalar kernel's early return.
+
+    Args:
+        base_scores: float64[N] raw semantic similarity scores
+        flags: int8[12, N] outcome codes, one row per factor
+        input_fidelity: Input quality score used by Factor 12
+
+    Returns:
+        float64[N] final scores bounded to [0.0, 1.0]
+    """
+    scores = np.array(base_scores, dtype=np.float64)
+    blocked = flags[PROPRIETY] == PROPRIETY_BLOCK
+
+    scores += np.where(flags[ASSOCIATION] == 1, 0.15, 0.0)
+    scores *= np.where(flags[OPPOSITION] == 1, 0.1, 1.0)
+    scores += np.select([flags[PURPOSE] == 1, flags[PURPOSE] == 2], [0.20, 0.10], 0.0)
+    scores += np.select([flags[SITUATION] == 1, flags[SITUATION] == -1], [0.15, -0.05], 0.0)
+    scores += np.where(flags[INDICATOR] == 1, 0.08, 0.0)
+    scores *= np.select([flags[PROPRIETY] == 2, flags[PROPRIETY] == 3], [0.8, 1.1], 1.0)
+    scores += np.select(
+        [flags[PLACE] == 1, flags[PLACE] == -1, flags[PLACE] == -2],
+        [0.18, -0.15, -0.05],
+        0.0
+    )
+    scores += np.select([flags[TIME] == 1, flags[TIME] == -1], [0.15, -0.05], 0.0)
+    scores += np.select([flags[INDIVIDUAL] == 1, flags[INDIVIDUAL] == 2], [0.12, 0.06], 0.0)
+    scores += np.where(flags[INTONATION] == 1, 0.08, 0.0)
+    scores *= np.where(flags[DISTORTION] == 1, 0.5 + input_fidelity, 1.0)
+    scores[blocked] = 0.0
+
+    return np.clip(scores, 0.0, 1.0, out=scores)
+
+
+_scratch = threading.local()
+
+
+def scratch_flags() -> Any:
+    """
+    Return this thread's reusable flags buffer.
+
+    Numba needs a typed int8 array; the pure-Python kernel is faster on a
+    plain list. Callers must overwrite every slot before use.
+    """
+    flags = getattr(_scratch, 'flags', None)
+    if flags is None:
+        if NUMBA_AVAILABLE:
+            flags = np.zeros(NUM_FACTORS, dtype=np.int8)
+        else:
+            flags = [NO_EFFECT] * NUM_FACTORS
+        _scratch.flags = flags
+    return flags
@@ -8,17 +8,48 @@ Context Resolution Matrix.
 Unlike token prediction, this engine seeks the holistic meaning unit.
 """
 
-from typing import List, Dict, Optional, Tuple, Any, Union
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Any, Union, TYPE_CHECKING
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
+import hashlib
 import json
+import os
 import numpy as np
 from numpy.typing import NDArray
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+else:
+    # Bound on first use by _sentence_transformer_class; patching this name
+    # (e.g. with a stub model) never imports sentence_transformers
+    SentenceTransformer = None
 
 from .context_matrix import ContextResolutionMatrix, ContextObject
 from .normalization_layer import NormalizationLayer
 
+# Quantized ONNX export shipped with the sentence-transformers hub models
+DEFAULT_ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Number of recent input embeddings kept in memory
+QUERY_CACHE_SIZE = 1024
+
+
+def _sentence_transformer_class() -> Any:
+    """
+    Import SentenceTransformer on first use.
+    
+    sentence_transformers pulls in torch/transformers, which dominates the
+    import time of the whole core package. Deferring it keeps modules that
+    never encode anything (context matrix, weighter, tests) fast to import.
+    A SentenceTransformer patched onto this module takes precedence.
+    """
+    global SentenceTransformer
+    if SentenceTransformer is None:
+        from sentence_transformers import SentenceTransformer as cls
+        SentenceTransformer = cls
+    return SentenceTransformer
+
 # Try to import ChromaDB version, fallback to simple version
 try:
     from .fast_memory import FastMemory, MemoryCandidate, boost_candidates_with_memory  # type: ignore
@@ -130,7 +161,9 @@ class IntentEngine:
         model_name: str = "all-MiniLM-L6-v2",
         use_normalization: bool = True,
         use_fast_memory: bool = True,
-        memory_boost_weight: float = 0.2
+        memory_boost_weight: float = 0.2,
+        backend: Optional[str] = None,
+        embedding_cache_dir: Optional[str] = None
     ) -> None:
         """
         Initialize the Intent Engine.
@@ -141,9 +174,19 @@ class IntentEngine:
             use_normalization: Whether to apply input normalization
             use_fast_memory: Whether to enable Fast Memory layer
             memory_boost_weight: Weight for Fast Memory boost (0.0 to 1.0)
+            backend: Embedding backend, "torch" (default) or "onnx" for the
+                int8-quantized ONNX Runtime export. Falls back to the
+                SBERT_BACKEND environment variable when not given.
+            embedding_cache_dir: Directory where intent embeddings are saved
+                as .npy files so restarts skip re-encoding the corpus. Falls
+                back to SBERT_EMBEDDING_CACHE_DIR; disabled when neither is set.
         """
         # Initialize components
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        self.backend = backend or os.getenv("SBERT_BACKEND", "torch")
+        self.model = self._load_model(model_name, self.backend)
+        self.embedding_cache_dir = embedding_cache_dir or os.getenv("SBERT_EMBEDDING_CACHE_DIR")
+        self._query_cache: "OrderedDict[str, NDArray[np.float32]]" = OrderedDict()
         self.crm = ContextResolutionMatrix()
         self.normalization = NormalizationLayer() if use_normalization else None
         
@@ -160,6 +203,34 @@ class IntentEngine:
         self.intent_embeddings: Optional[NDArray[np.float32]] = None
         self.load_intents(intents_path)
     
+    @staticmethod
+    def _load_model(model_name: str, backend: str) -> "SentenceTransformer":
+        """
+        Load the Sentence-BERT model for the requested backend.
+        
+        The "onnx" backend runs the dynamically int8-quantized export through
+        ONNX Runtime (requires sentence-transformers>=3.2 with the [onnx]
+        extra). SBERT_ONNX_FILE overrides which ONNX file is loaded.
+        
+        Args:
+            model_name: Sentence-BERT model identifier
+            backend: "torch" or "onnx"
+            
+        Returns:
+            Loaded SentenceTransformer
+        """
+        SentenceTransformer = _sentence_transformer_class()
+        
+        if backend == "torch":
+            return SentenceTransformer(model_name)
+        
+        onnx_file = os.getenv("SBERT_ONNX_FILE", DEFAULT_ONNX_INT8_FILE)
+        return SentenceTransformer(
+            model_name,
+            backend=backend,
+            model_kwargs={"file_name": onnx_file}
+        )
+    
     def load_intents(self, path: str) -> None:
         """
         Load Pure Meanings corpus from JSON file.
@@ -185,24 +256,66 @@ class IntentEngine:
         self._compute_intent_embeddings()
     
     def _compute_intent_embeddings(self) -> None:
-        """Pre-compute semantic vectors for all pure meanings."""
+        """
+        Pre-compute semantic vectors for all pure meanings.
+        
+        All texts are encoded in a single batch. When an embedding cache
+        directory is configured, the matrix is saved under a sha256 key of
+        the model, backend and texts, and reloaded on later starts.
+        """
         pure_texts = [intent.pure_text for intent in self.intents]
-        embeddings = self.model.encode(
-            pure_texts,
-            convert_to_numpy=True,
-            show_progress_bar=False,
-            normalize_embeddings=True
-        )
+        cache_file = self._embedding_cache_file(pure_texts)
         
-        self.intent_embeddings = embeddings
+        if cache_file is not None and cache_file.exists():
+            embeddings = np.load(cache_file)
+        else:
+            embeddings = self.model.encode(
+                pure_texts,
+                batch_size=64,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+                normalize_embeddings=True
+            )
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write then rename, so processes sharing the cache directory
+                # (e.g. pytest-xdist workers) never load a half-written file
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, 'wb') as f:
+                    np.save(f, embeddings)
+                os.replace(tmp_file, cache_file)
+        
+        self.intent_embeddings = np.ascontiguousarray(embeddings)
         for i, intent in enumerate(self.intents):
             intent.embedding = embeddings[i]
     
+    def _embedding_cache_file(self, texts: List[str]) -> Optional[Path]:
+        """
+        Path of the saved intent embeddings for these texts, if caching is on.
+        
+        Args:
+            texts: Corpus texts in encoding order
+            
+        Returns:
+            Path to the .npy file, or None when no cache directory is set
+        """
+        if not self.embedding_cache_dir:
+            return None
+        
+        digest = hashlib.sha256()
+        digest.update(f"{self.model_name}\0{self.backend}".encode("utf-8"))
+        for text in texts:
+            digest.update(b"\0" + text.encode("utf-8"))
+        
+        return Path(self.embedding_cache_dir) / f"intents.{digest.hexdigest()[:16]}.emb.npy"
+    
     def _encode_input(self, text: str) -> Tuple[NDArray[np.float32], float]:
         """
         Encode user input to semantic vector.
         
-        Applies input normalization if enabled.
+        Applies input normalization if enabled. Embeddings of the last
+        QUERY_CACHE_SIZE distinct (post-normalization) inputs are kept in an LRU
+        cache, so repeated queries skip the model.
         
         Args:
             text: User input text
@@ -219,6 +332,13 @@ class IntentEngine:
         else:
             text_to_encode = text
         
+        cache_key = text_to_encode
+        embedding = self._query_cache.get(cache_key)
+        
+        if embedding is not None:
+            self._query_cache.move_to_end(cache_key)
+            return embedding, distortion_score
+        
         # Encode to semantic space
         embedding = self.model.encode(
             text_to_encode,
@@ -227,6 +347,12 @@ class IntentEngine:
             normalize_embeddings=True
         )
         
+        # Shared between callers, so keep it read-only
+        embedding.setflags(write=False)
+        self._query_cache[cache_key] = embedding
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        
         return embedding, distortion_score
     
     @staticmethod
@@ -264,12 +390,10 @@ class IntentEngine:
         similarities = {}
         
         if self.intent_embeddings is not None:
-            for i, intent in enumerate(self.intents):
-                similarity = self.cosine_similarity(
-                    input_embedding,
-                    self.intent_embeddings[i]
-                )
-                similarities[intent.id] = similarity
+            # Vectors are normalized, so one matrix-vector product gives
+            # every cosine similarity at once
+            scores = np.clip(self.intent_embeddings @ input_embedding, 0.0, 1.0)
+            similarities = dict(zip((intent.id for intent in self.intents), scores.tolist()))
         
         return similarities
     
@@ -595,10 +719,10 @@ class IntentEngine:
         """
         from datetime import datetime
         
-        # If already a ContextObject, update distortion and return
+        # If already a ContextObject, fill in distortion and return
         if isinstance(current_context, ContextObject):
             if distortion_score > 0 and current_context.distortion is None:
-                current_context.distortion = distortion_score
+                return replace(current_context, distortion=distortion_score)
             return current_context
         
         # If None, create empty context
@@ -799,6 +923,7 @@ class IntentEngine:
         info = {
             "model_name": self.model.get_sentence_embedding_dimension(),
             "embedding_dimension": self.model.get_sentence_embedding_dimension(),
+            "backend": self.backend,
             "intent_count": len(self.intents),
             "apabhramsa_enabled": self.normalization is not None,
             "crm_factors": list(self.crm.weights.keys()),
@@ -842,3 +967,14 @@ class IntentEngine:
         """Clear all stored memories in Fast Memory layer."""
         if self.fast_memory:
             self.fast_memory.clear_memory()
+    
+    def enable_fast_memory(self) -> None:
+        """
+        Open the Fast Memory layer on an engine built without it.
+        
+        Used after a fork: the gunicorn master preloads the engine with
+        use_fast_memory=False, and each worker opens its own ChromaDB client.
+        """
+        if self.fast_memory is None:
+            self.fast_memory = FastMemory()
+        self.use_fast_memory = True
@@ -9,10 +9,11 @@ Models:
   - IntentRequest: User input + context wrapper
   - ResolutionFactor: Individual factor contribution
   - IntentResponse: Full resolution result with audit trail
+  - BatchIntentRequest / BatchIntentResponse: Several resolutions in one call
   - HealthResponse: System health status
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -22,6 +23,35 @@ if TYPE_CHECKING:
     from core import ContextSnapshot
 
 
+# ============================================================================
+# TIMESTAMP PARSING
+# ============================================================================
+
+def _parse_iso8601(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp into a datetime.
+    
+    The canonical `YYYY-MM-DDTHH:MM:SSZ` form used by API clients is parsed
+    by slicing fixed offsets once every field is all digits; anything else
+    falls back to
+    `datetime.fromisoformat`.
+    
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 timestamp
+    """
+    if (
+        len(value) == 20 and value[19] == 'Z' and value[10] == 'T'
+        and value[4] == '-' and value[7] == '-'
+        and value[13] == ':' and value[16] == ':'
+        and value.isascii()
+    ):
+        fields = (value[0:4], value[5:7], value[8:10], value[11:13], value[14:16], value[17:19])
+        # int() accepts signs and whitespace (" 0"), which fromisoformat rejects
+        if all(field.isdigit() for field in fields):
+            return datetime(*map(int, fields), tzinfo=timezone.utc)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 # ============================================================================
 # CONTEXT MODEL - 12-FACTOR CONTEXT SNAPSHOT
 # ============================================================================
@@ -61,6 +91,7 @@ class ContextModel(BaseModel):
     """
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -192,9 +223,7 @@ class ContextModel(BaseModel):
         temporal = None
         if self.temporal_context:
             try:
-                temporal = datetime.fromisoformat(
-                    self.temporal_context.replace('Z', '+00:00')
-                )
+                temporal = _parse_iso8601(self.temporal_context)
             except ValueError as e:
                 raise ValueError(f"Invalid temporal context format: {e}")
 
@@ -239,6 +268,7 @@ class IntentRequest(BaseModel):
     """
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -315,6 +345,7 @@ class ResolutionFactor(BaseModel):
     """
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "factor_name": "location_context",
@@ -369,6 +400,7 @@ class IntentResponse(BaseModel):
     """
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "resolved_intent": "transfer_to_account",
@@ -457,6 +489,48 @@ class IntentResponse(BaseModel):
     )
 
 
+# ============================================================================
+# BATCH RESOLUTION - SEVERAL REQUESTS PER CALL
+# ============================================================================
+
+# Upper bound on requests accepted by one /resolve-intent/batch call
+MAX_BATCH_SIZE = 64
+
+
+class BatchIntentRequest(BaseModel):
+    """
+    **Batch Intent Resolution Request**
+    
+    Several independent resolution requests sent in one HTTP call, saving a
+    round-trip and a JSON parse per request. Each item is validated exactly
+    like a single `/resolve-intent` body; one invalid item rejects the batch.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    requests: List[IntentRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"**Resolution requests, resolved in order.** 1 to {MAX_BATCH_SIZE} items."
+    )
+
+
+class BatchIntentResponse(BaseModel):
+    """
+    **Batch Intent Resolution Response**
+    
+    One `IntentResponse` per request, in the same order as the request list.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    results: List[IntentResponse] = Field(
+        ...,
+        description="**Resolution results** aligned index-for-index with `requests`."
+    )
+
+
 # ============================================================================
 # HEALTH RESPONSE - SYSTEM STATUS
 # ============================================================================
@@ -470,6 +544,7 @@ class HealthResponse(BaseModel):
     """
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "status": "healthy",
@@ -0,0 +1,39 @@
+"""
+Gunicorn configuration for production deployments of the Sphota API.
+
+Usage:
+    gunicorn -c gunicorn.conf.py main:app
+
+The app is imported once in the master process (preload_app) with
+SPHOTA_PRELOAD_ENGINE=1, so the SBERT model and corpus embeddings are
+loaded a single time and shared with the forked Uvicorn workers through
+copy-on-write pages instead of being loaded again by every worker. State
+that must not cross fork() stays per worker: each worker opens its own
+ChromaDB client in the app lifespan and sizes its own torch thread pool in
+post_fork (SPHOTA_TORCH_THREADS, default 1).
+
+Gunicorn requires fork() and is not available on Windows; use
+`python main.py` or `uvicorn main:app` there (one model copy per worker).
+"""
+
+import multiprocessing
+import os
+
+# Tell main.py to build the engine at import time (in the master)
+os.environ.setdefault("SPHOTA_PRELOAD_ENGINE", "1")
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", max(2, multiprocessing.cpu_count() - 1)))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+accesslog = None
+
+
+def post_fork(server, worker):
+    """Size torch's intra-op thread pool in each worker, after the fork."""
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(int(os.getenv("SPHOTA_TORCH_THREADS", "1")))
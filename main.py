@@ -36,12 +36,16 @@ docker-compose up  # One-command deployment
 """
 
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from typing import Any, Dict, Optional
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 
 # Import Sphota engine
 from core import SphotaEngine, ContextSnapshot
@@ -57,6 +61,8 @@ from core.models import (
     ContextModel,
     IntentRequest,
     IntentResponse,
+    BatchIntentRequest,
+    BatchIntentResponse,
     ResolutionFactor,
     HealthResponse,
     FeedbackRequest,
@@ -72,6 +78,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolutions below this confidence are flagged as requiring confirmation
+CONFIRMATION_THRESHOLD = 0.75
+
+# Maximum number of candidate scores echoed in audit_trail["all_scores"]
+# unless the caller asks for the full set with ?verbose=true
+AUDIT_TRAIL_MAX_SCORES = 10
+
 
 # ============================================================================
 # STARTUP/SHUTDOWN LOGIC
@@ -80,6 +93,14 @@ logger = logging.getLogger(__name__)
 # Global engine instance (loaded once at startup)
 sphota_engine: Optional[SphotaEngine] = None
 
+# Under `gunicorn --preload` (see gunicorn.conf.py) the engine is built once in
+# the master process so forked workers share the SBERT weights and corpus
+# embeddings copy-on-write. Only that read-only state is preloaded: the
+# ChromaDB client behind Fast Memory is opened per worker in the lifespan hook.
+if os.getenv("SPHOTA_PRELOAD_ENGINE") == "1":
+    logger.info("Preloading Sphota engine before worker fork...")
+    sphota_engine = SphotaEngine(use_fast_memory=False)
+
 # Global settings instance (validated at startup)
 settings: Optional[Settings] = None
 
@@ -116,7 +137,11 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing Sphota Intent Engine...")
 
     try:
-        sphota_engine = SphotaEngine()
+        if sphota_engine is None:
+            sphota_engine = SphotaEngine()
+        else:
+            logger.info("✓ Reusing preloaded Sphota engine")
+            sphota_engine.intent_engine.enable_fast_memory()
         logger.info("✓ Sphota engine initialized successfully")
         logger.info("✓ SBERT model loaded")
         logger.info("✓ Context resolution engine ready")
@@ -267,6 +292,109 @@ async def health_check() -> HealthResponse:
     )
 
 
+def _resolve_one(request: IntentRequest, verbose: bool) -> IntentResponse:
+    """
+    Resolve a single request into an IntentResponse.
+    
+    Shared by /resolve-intent and /resolve-intent/batch; the caller checks
+    that the engine is loaded and maps exceptions to HTTP errors.
+    """
+    start_time = time.perf_counter()
+    
+    # Log incoming request
+    logger.info(f"Resolving intent: '{request.command_text[:50]}...'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Context factors: {request.context.model_dump(exclude_none=True)}")
+    
+    # Convert Pydantic model to core ContextSnapshot
+    context_snapshot = request.context.to_context_snapshot()
+    
+    # Call Sphota engine
+    resolution_result = sphota_engine.resolve(
+        request.command_text,
+        context_snapshot
+    )
+    
+    # Extract results from resolution (assuming ResolutionResult has these attributes)
+    resolved_scores = resolution_result.resolved_scores
+    active_factors = resolution_result.active_factors or []
+    factor_contributions = resolution_result.factor_contributions or {}
+    confidence = resolution_result.confidence_estimate
+    
+    # Rank candidates once: top intent, alternatives and audit scores
+    # are all sliced from this single ordering
+    ranked = sorted(resolved_scores.items(), key=itemgetter(1), reverse=True)
+    top_intent_name, top_confidence = ranked[0] if ranked else ("unknown", 0.0)
+    
+    # Build contributing factors list
+    contributing = []
+    for factor_name, contribution in factor_contributions.items():
+        delta = contribution.get('delta', 0.0)
+        influence_value = contribution.get('influence', 'neutral')
+        # Ensure influence is a string
+        influence_type = str(influence_value) if influence_value is not None else 'neutral'
+        # Engine output is already typed, so skip re-validation
+        contributing.append(
+            ResolutionFactor.model_construct(
+                factor_name=factor_name,
+                delta=delta,
+                influence=influence_type
+            )
+        )
+    
+    # Sort by absolute delta contribution (descending)
+    contributing.sort(key=lambda x: abs(x.delta), reverse=True)
+    
+    # Build alternative intents (excluding top), best first
+    alternatives = dict(ranked[1:])
+    
+    # Calculate processing time
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    
+    # Build action payload (can be extended based on intent type)
+    action_payload = {
+        "intent_category": top_intent_name.partition('_')[0],
+        "intent_type": top_intent_name,
+        "requires_confirmation": top_confidence < CONFIRMATION_THRESHOLD,
+    }
+    
+    # Build audit trail (only the top candidates unless verbose)
+    total_intents = len(resolved_scores)
+    truncated = not verbose and total_intents > AUDIT_TRAIL_MAX_SCORES
+    if truncated:
+        all_scores = dict(ranked[:AUDIT_TRAIL_MAX_SCORES])
+    else:
+        all_scores = resolved_scores
+    
+    audit_trail = {
+        "input_text": request.command_text,
+        "normalized_text": getattr(resolution_result, 'normalized_text', None),
+        "active_factors": active_factors,
+        "all_scores": all_scores,
+        "total_intents": total_intents,
+        "resolution_timestamp": datetime.utcnow().isoformat() + "Z",
+    }
+    if truncated:
+        audit_trail["all_scores_truncated_to"] = AUDIT_TRAIL_MAX_SCORES
+    
+    # Build response
+    response = IntentResponse(
+        resolved_intent=top_intent_name,
+        confidence_score=top_confidence,
+        contributing_factors=contributing,
+        alternative_intents=alternatives if alternatives else None,
+        action_payload=action_payload,
+        audit_trail=audit_trail,
+        processing_time_ms=elapsed_ms,
+    )
+    
+    logger.info(
+        f"✓ Resolved: {top_intent_name} (confidence: {top_confidence:.2%}) in {elapsed_ms:.2f}ms"
+    )
+    
+    return response
+
+
 @app.post(
     "/resolve-intent",
     response_model=IntentResponse,
@@ -314,7 +442,8 @@ The `context` object requires **strict English keys** (not Sanskrit terminology)
 - `contributing_factors` (list): Ordered by contribution magnitude
 - `alternative_intents` (dict): Runner-up scores for transparency
 - `action_payload` (dict): Structured data for downstream execution
-- `audit_trail` (dict): Full decision log including normalized text, all scores, timestamp
+- `audit_trail` (dict): Full decision log including normalized text, top scores, timestamp
+  (`all_scores` is limited to the 10 best candidates; pass `?verbose=true` for every score)
 - `processing_time_ms` (float): Inference latency (target: <5ms)
 
 ### Banking Example
@@ -371,7 +500,7 @@ Response:
 """,
     response_description="Resolved intent with confidence, audit trail, and performance metrics",
 )
-async def resolve_intent(request: IntentRequest) -> IntentResponse:
+async def resolve_intent(request: IntentRequest, verbose: bool = False) -> IntentResponse:
     """Resolve user intent using the 12-Factor Context Resolution Engine."""
     
     # Check engine is initialized
@@ -383,96 +512,48 @@ async def resolve_intent(request: IntentRequest) -> IntentResponse:
         )
     
     try:
-        import time
-        start_time = time.time()
-        
-        # Log incoming request
-        logger.info(f"Resolving intent: '{request.command_text[:50]}...'")
-        logger.debug(f"Context factors: {request.context.dict(exclude_none=True)}")
-        
-        # Convert Pydantic model to core ContextSnapshot
-        context_snapshot = request.context.to_context_snapshot()
+        return _resolve_one(request, verbose)
         
-        # Call Sphota engine
-        resolution_result = sphota_engine.resolve(
-            request.command_text,
-            context_snapshot
+    except Exception as e:
+        logger.error(f"Resolution failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Intent resolution failed: {str(e)}"
         )
-        
-        # Extract results from resolution (assuming ResolutionResult has these attributes)
-        resolved_scores = resolution_result.resolved_scores
-        active_factors = resolution_result.active_factors or []
-        factor_contributions = resolution_result.factor_contributions or {}
-        confidence = resolution_result.confidence_estimate
-        
-        # Get top intent
-        top_intent = max(resolved_scores.items(), key=lambda x: x[1]) if resolved_scores else ("unknown", 0.0)
-        top_intent_name = top_intent[0]
-        top_confidence = top_intent[1]
-        
-        # Build contributing factors list
-        contributing = []
-        for factor_name, contribution in factor_contributions.items():
-            delta = contribution.get('delta', 0.0)
-            influence_value = contribution.get('influence', 'neutral')
-            # Ensure influence is a string
-            influence_type = str(influence_value) if influence_value is not None else 'neutral'
-            contributing.append(
-                ResolutionFactor(
-                    factor_name=factor_name,
-                    delta=delta,
-                    influence=influence_type
-                )
-            )
-        
-        # Sort by absolute delta contribution (descending)
-        contributing.sort(key=lambda x: abs(x.delta), reverse=True)
-        
-        # Build alternative intents (excluding top)
-        alternatives = {
-            intent: score
-            for intent, score in resolved_scores.items()
-            if intent != top_intent_name
-        }
-        
-        # Calculate processing time
-        elapsed_ms = (time.time() - start_time) * 1000
-        
-        # Build action payload (can be extended based on intent type)
-        action_payload = {
-            "intent_category": top_intent_name.split('_')[0],
-            "intent_type": top_intent_name,
-            "requires_confirmation": top_confidence < 0.75,
-        }
-        
-        # Build audit trail
-        audit_trail = {
-            "input_text": request.command_text,
-            "normalized_text": getattr(resolution_result, 'normalized_text', None),
-            "active_factors": active_factors,
-            "all_scores": resolved_scores,
-            "resolution_timestamp": datetime.utcnow().isoformat() + "Z",
-        }
-        
-        # Build response
-        response = IntentResponse(
-            resolved_intent=top_intent_name,
-            confidence_score=top_confidence,
-            contributing_factors=contributing,
-            alternative_intents=alternatives if alternatives else None,
-            action_payload=action_payload,
-            audit_trail=audit_trail,
-            processing_time_ms=elapsed_ms,
+
+
+@app.post(
+    "/resolve-intent/batch",
+    response_model=BatchIntentResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["Intent Resolution"],
+    summary="Resolve Several Intents in One Call",
+    description="""
+Resolve up to 64 `/resolve-intent` request bodies in a single HTTP call.
+
+Each item is validated and resolved exactly as `/resolve-intent` would, and
+`results[i]` answers `requests[i]`. Batching saves one round-trip and one
+JSON parse per request for clients with several commands in hand.
+""",
+    response_description="One resolution result per request, in request order",
+)
+async def resolve_intent_batch(request: BatchIntentRequest, verbose: bool = False) -> BatchIntentResponse:
+    """Resolve a batch of user inputs with the 12-Factor Context Resolution Engine."""
+    
+    if sphota_engine is None:
+        logger.error("Sphota engine not initialized")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sphota engine not initialized. Server starting up?"
         )
-        
-        logger.info(
-            f"✓ Resolved: {top_intent_name} (confidence: {top_confidence:.2%}) in {elapsed_ms:.2f}ms"
+    
+    try:
+        return BatchIntentResponse(
+            results=[_resolve_one(item, verbose) for item in request.requests]
         )
         
-        return response
-        
     except Exception as e:
-        logger.error(f"Resolution failed: {str(e)}", exc_info=True)
+        logger.error(f"Batch resolution failed: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Intent resolution failed: {str(e)}"
@@ -483,9 +564,16 @@ async def resolve_intent(request: IntentRequest) -> IntentResponse:
     "/factors",
     tags=["System"],
     summary="Get information about resolution factors",
-    description="Retrieve metadata about the 12 context resolution factors."
+    description=(
+        "Retrieve metadata about the 12 context resolution factors. "
+        "`limit` returns only the first N factors and `summary=true` returns "
+        "only their weights; the totals always cover all factors."
+    )
 )
-async def get_factors() -> Dict[str, Any]:
+async def get_factors(
+    limit: Optional[int] = Query(None, ge=0, description="Return only the first N factors"),
+    summary: bool = Query(False, description="Return only each factor's weight"),
+) -> Dict[str, Any]:
     """
     Get metadata about the 12 context resolution factors.
     
@@ -562,8 +650,16 @@ async def get_factors() -> Dict[str, Any]:
         },
     }
     
+    selected = factors.items()
+    if limit is not None:
+        selected = islice(selected, limit)
+    if summary:
+        listed = {name: {"weight": info["weight"]} for name, info in selected}
+    else:
+        listed = dict(selected)
+    
     return {
-        "factors": factors,
+        "factors": listed,
         "total_factors": len(factors),
         "total_weight": sum(f["weight"] for f in factors.values()),
     }
@@ -864,7 +960,7 @@ async def get_review_queue() -> Dict[str, Any]:
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
     """Handle Pydantic validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": f"Validation error: {str(exc)}"},
     )
@@ -895,6 +991,7 @@ async def root():
         "endpoints": {
             "health": "/health",
             "resolve": "/resolve-intent",
+            "resolve_batch": "/resolve-intent/batch",
             "factors": "/factors",
         },
         "source": "https://github.com/vineeth1169/SPHOTA.AI",
@@ -909,10 +1006,15 @@ if __name__ == "__main__":
     import uvicorn
     
     # Run with: uvicorn main:app --host 0.0.0.0 --port 8000 --workers 4 --reload
+    # uvloop/httptools are picked up automatically when installed (uvicorn[standard])
+    default_workers = max(2, (os.cpu_count() or 2) - 1)
     uvicorn.run(
-        app,
+        "main:app",
         host="0.0.0.0",
         port=8000,
-        workers=1,  # Set to 4+ in production
+        workers=int(os.getenv("WEB_CONCURRENCY", default_workers)),
+        loop="auto",
+        http="auto",
         log_level="info",
+        access_log=False,
     )
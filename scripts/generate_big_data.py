@@ -6,7 +6,7 @@ This script creates data/context_test_data_large.csv with realistic ambiguity
 resolution scenarios. Each test case follows strict If-Then logic rules.
 
 Usage:
-    python scripts/generate_big_data.py
+    python scripts/generate_big_data.py [--verbose] [--workers N]
 
 Output:
     - data/context_test_data_large.csv (10,000 rows)
@@ -14,13 +14,29 @@ Output:
     - All columns follow strict deterministic logic
 """
 
+import argparse
+import csv
+import numpy as np
 import pandas as pd
-import uuid
 import random
-from typing import Tuple, Dict
+import re
+import sys
+from typing import Tuple, Dict, List, Optional, Iterator
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool
+from operator import attrgetter
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # pyarrow is optional - fall back to DataFrame.to_csv
+    pa = None
+
 
 # ============================================================================
 # FACTOR VALUE DEFINITIONS (Strict English Terminology)
@@ -77,6 +93,34 @@ INTONATIONS = [
 
 FIDELITIES = [0.95, 0.85, 0.75, 0.5, 0.3]
 
+# Rows generated and written per chunk
+DEFAULT_CHUNK_SIZE = 2000
+
+# Value pool for each ctx_* column, in ContextFactors field order
+FACTOR_CHOICES = {
+    "ctx_association": ASSOCIATIONS,
+    "ctx_conflict_check": CONFLICT_CHECKS,
+    "ctx_active_goal": ACTIVE_GOALS,
+    "ctx_screen_state": SCREEN_STATES,
+    "ctx_syntax_flag": SYNTAX_FLAGS,
+    "ctx_base_score": BASE_SCORES,
+    "ctx_social_mode": SOCIAL_MODES,
+    "ctx_location": LOCATIONS,
+    "ctx_time_of_day": TIME_OF_DAY,
+    "ctx_user_profile": USER_PROFILES,
+    "ctx_intonation": INTONATIONS,
+    "ctx_fidelity": FIDELITIES,
+}
+
+# Fixed category set for each string ctx_* column ("greeting" only comes
+# from the edge-case generator)
+CATEGORY_DTYPES = {
+    column: pd.CategoricalDtype(values)
+    for column, values in FACTOR_CHOICES.items()
+    if column not in ("ctx_base_score", "ctx_fidelity")
+}
+CATEGORY_DTYPES["ctx_syntax_flag"] = pd.CategoricalDtype(SYNTAX_FLAGS + ["greeting"])
+
 
 # ============================================================================
 # TEST INPUTS (Core scenarios)
@@ -102,14 +146,82 @@ TEST_INPUTS = {
 
 SLANG_INPUTS = ["Wudder", "Wader", "Bet", "Fax", "Slay", "Bussin"]
 
+# Hard disambiguation scenarios: edge_case_type -> (candidate inputs,
+# factor overrides). Factors without an override are drawn at random; a
+# tuple override is drawn from its members.
+EDGE_CASE_SCENARIOS = {
+    "book_it_travel": (("Book it",), {
+        "ctx_association": "travel_history", "ctx_active_goal": "book_travel",
+        "ctx_syntax_flag": "command", "ctx_base_score": 0.95, "ctx_fidelity": 0.95,
+    }),
+    "book_it_dining": (("Book it",), {
+        "ctx_association": "dining_history", "ctx_screen_state": "on_restaurant_app",
+        "ctx_syntax_flag": "command", "ctx_base_score": 0.95, "ctx_location": "Restaurant",
+        "ctx_fidelity": 0.95,
+    }),
+    "turn_on_lights": (("Turn on lights",), {
+        "ctx_conflict_check": "lights_already_on", "ctx_active_goal": "control_home",
+        "ctx_syntax_flag": "command", "ctx_base_score": 0.8, "ctx_location": "Home",
+        "ctx_intonation": "Emphatic", "ctx_fidelity": 0.95,
+    }),
+    "slang_business": (("That's sick", "No cap"), {
+        "ctx_screen_state": "on_home_screen", "ctx_syntax_flag": "statement",
+        "ctx_base_score": 0.7, "ctx_social_mode": "Business", "ctx_location": "Office",
+        "ctx_fidelity": 0.85,
+    }),
+    "slang_casual": (("That's sick", "No cap"), {
+        "ctx_syntax_flag": "statement", "ctx_base_score": 0.7, "ctx_social_mode": "Casual",
+        "ctx_location": ("Home", "Car"), "ctx_fidelity": 0.85,
+    }),
+    "go_bank_nature": (("Go to the bank",), {
+        "ctx_screen_state": "on_map_app", "ctx_syntax_flag": "command", "ctx_base_score": 0.8,
+        "ctx_location": "Nature/Wilderness", "ctx_intonation": "Flat", "ctx_fidelity": 0.95,
+    }),
+    "go_bank_city": (("Go to the bank",), {
+        "ctx_screen_state": "on_banking_app", "ctx_syntax_flag": "command", "ctx_base_score": 0.8,
+        "ctx_location": "City_Center", "ctx_intonation": "Flat", "ctx_fidelity": 0.95,
+    }),
+    "good_morning_night": (("Good morning",), {
+        "ctx_syntax_flag": "greeting", "ctx_base_score": 0.6, "ctx_time_of_day": "23:00",
+        "ctx_fidelity": 0.95,
+    }),
+    "good_morning_morning": (("Good morning",), {
+        "ctx_syntax_flag": "greeting", "ctx_base_score": 0.6, "ctx_time_of_day": "06:00",
+        "ctx_fidelity": 0.95,
+    }),
+    "right_rising": (("Right",), {
+        "ctx_syntax_flag": "question", "ctx_base_score": 0.8, "ctx_intonation": "Rising",
+        "ctx_fidelity": 0.95,
+    }),
+    "right_flat": (("Right",), {
+        "ctx_syntax_flag": "statement", "ctx_base_score": 0.8, "ctx_intonation": "Flat",
+        "ctx_fidelity": 0.95,
+    }),
+    "distortion_low_fidelity": (("Wudder", "Bet", "Slay"), {
+        "ctx_base_score": 0.3, "ctx_fidelity": 0.3,
+    }),
+    "distortion_gen_z": (("Wudder", "Bet", "Slay"), {
+        "ctx_base_score": 0.8, "ctx_user_profile": "Gen_Z", "ctx_fidelity": 0.7,
+    }),
+}
+
+EDGE_CASE_TYPES = list(EDGE_CASE_SCENARIOS)
+
+# Intern every category value and test input so that comparisons and dict
+# lookups against them short-circuit on object identity
+for _values in FACTOR_CHOICES.values():
+    _values[:] = [sys.intern(v) if isinstance(v, str) else v for v in _values]
+TEST_INPUTS = {key: sys.intern(text) for key, text in TEST_INPUTS.items()}
+SLANG_INPUTS[:] = map(sys.intern, SLANG_INPUTS)
+
 
 # ============================================================================
 # DETERMINISTIC SCENARIO LOGIC
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextFactors:
-    """Container for all 12 context factors."""
+    """Container for all 12 context factors (immutable and hashable)."""
     ctx_association: str
     ctx_conflict_check: str
     ctx_active_goal: str
@@ -124,6 +236,143 @@ class ContextFactors:
     ctx_fidelity: float
 
 
+# ============================================================================
+# RULE TABLES (built once at import time)
+# ============================================================================
+
+SLANG_EXPRESSIONS = ["That's sick", "No cap", "That's lit", "No way"]
+
+SLANG_MAP = {
+    "Wudder": "water_command",
+    "Wader": "water_command",
+    "Bet": "confirm_action",
+    "Fax": "confirm_action",
+    "Slay": "sentiment_positive",
+    "Bussin": "sentiment_positive"
+}
+
+# One automaton over both slang vocabularies: Rule 3 expressions are
+# case-sensitive, Rule 7 distortions are not
+_VOCABULARY_RE = re.compile(
+    "(?P<slang>" + "|".join(map(re.escape, SLANG_EXPRESSIONS)) + ")"
+    "|(?i:(?P<distortion>" + "|".join(map(re.escape, SLANG_MAP)) + "))"
+)
+# Lowercased distortion -> (SLANG_MAP rank, corrected intent); when several
+# distortions appear, the earliest SLANG_MAP entry wins, not the earliest match
+_DISTORTION_INTENTS = {
+    slang.lower(): (rank, intent) for rank, (slang, intent) in enumerate(SLANG_MAP.items())
+}
+
+DEFAULT_INTENTS = {
+    "Wake me up": ("set_alarm", "wake_device"),
+    "Set an alarm for 7 AM": ("set_alarm", "schedule_reminder"),
+    "Play music": ("play_music", "play_audio"),
+    "Call mom": ("make_call", "send_message"),
+    "Order pizza": ("order_food", "search_restaurant"),
+    "What's the weather": ("get_weather", "open_weather_app"),
+}
+
+GENERIC_OUTCOME = ("generic_intent", "fallback_intent")
+
+_BOOK_IT_BY_ASSOCIATION = {
+    "travel_history": ("book_flight", "reserve_table"),
+    "dining_history": ("reserve_table", "book_flight"),
+    "shopping_history": ("complete_purchase", "book_flight"),
+}
+
+_LIGHTS_BY_CONFLICT = {
+    "lights_already_on": ("error_redundant_command", "turn_on_lights"),
+    "no_conflict": ("turn_on_lights", "error_redundant_command"),
+}
+
+_BANK_BY_LOCATION = {
+    "Nature/Wilderness": ("navigate_river_bank", "navigate_financial_bank"),
+    "City_Center": ("navigate_financial_bank", "navigate_river_bank"),
+    "Home": ("navigate_financial_bank", "navigate_river_bank"),
+}
+
+_MORNING_BY_TIME = {
+    "23:00": ("greeting_correction", "greeting_appropriate"),
+    "02:00": ("greeting_correction", "greeting_appropriate"),
+    "06:00": ("greeting_appropriate", "greeting_correction"),
+    "08:00": ("greeting_appropriate", "greeting_correction"),
+}
+
+_RIGHT_BY_INTONATION = {
+    "Rising": ("confirm_query", "affirmation"),
+    "Flat": ("affirmation", "confirm_query"),
+    "Questioning": ("confirm_query", "affirmation"),
+}
+
+
+@lru_cache(maxsize=256)
+def _scan_vocabulary(input_text: str) -> Tuple[bool, Optional[str]]:
+    """
+    Scan input_text once for both slang vocabularies.
+    
+    Cached per input_text: the generator only draws from a few dozen
+    distinct inputs, so each one is scanned once per run.
+    
+    Returns:
+        Tuple of (contains Rule 3 slang, corrected intent for the Rule 7
+        distortion listed first in SLANG_MAP, or None)
+    """
+    is_slang = False
+    distortion = None
+    for match in _VOCABULARY_RE.finditer(input_text):
+        if match.lastgroup == "slang":
+            is_slang = True
+        else:
+            candidate = _DISTORTION_INTENTS[match.group().lower()]
+            if distortion is None or candidate < distortion:
+                distortion = candidate
+    return is_slang, distortion[1] if distortion is not None else None
+
+
+# Exact-match inputs resolved by a single context factor:
+# input_text -> (ContextFactors field, outcome by field value, default outcome)
+_RULE_TABLES = {
+    # RULE 1: Factor 1 - Association (History/Sahacarya)
+    "Book it": (
+        "ctx_association", _BOOK_IT_BY_ASSOCIATION, ("booking_generic", "unknown_booking")
+    ),
+    # RULE 2: Factor 2 - Conflict Check (System State/Virodhitā)
+    "Turn on lights": (
+        "ctx_conflict_check", _LIGHTS_BY_CONFLICT, ("turn_on_lights", "error_conflict")
+    ),
+    # RULE 4: Factor 8 - Location (Place/Deśa) - The "Bank" Problem
+    "Go to the bank": (
+        "ctx_location", _BANK_BY_LOCATION, ("navigate_bank_ambiguous", "navigate_unknown")
+    ),
+    # RULE 5: Factor 9 - Time of Day (Time/Kāla)
+    "Good morning": (
+        "ctx_time_of_day", _MORNING_BY_TIME, ("greeting_contextual", "greeting_correction")
+    ),
+    # RULE 6: Factor 11 - Intonation (Intonation/Svara)
+    "Right": (
+        "ctx_intonation", _RIGHT_BY_INTONATION, ("affirmation_neutral", "confirm_query")
+    ),
+}
+
+# _RULE_TABLES flattened for evaluation over factor code arrays: the outcome
+# for rule input i and factor code c sits at index (i << 4) | c
+_RULE_INPUT_IDS = {input_text: i for i, input_text in enumerate(_RULE_TABLES)}
+_RULE_FACTOR_INDEX = np.array(
+    [list(FACTOR_CHOICES).index(factor) for factor, _, _ in _RULE_TABLES.values()]
+)
+_OUTCOME_EXPECTED = np.empty(len(_RULE_TABLES) << 4, dtype=object)
+_OUTCOME_CONFLICTING = np.empty(len(_RULE_TABLES) << 4, dtype=object)
+for _input_id, (_factor, _table, _default) in enumerate(_RULE_TABLES.values()):
+    assert len(FACTOR_CHOICES[_factor]) <= 16, _factor
+    for _code, _value in enumerate(FACTOR_CHOICES[_factor]):
+        _key = (_input_id << 4) | _code
+        _OUTCOME_EXPECTED[_key], _OUTCOME_CONFLICTING[_key] = _table.get(_value, _default)
+
+# Rule input id for each TEST_INPUTS value (-1 if no single-factor rule)
+_TEST_INPUT_TEXTS = np.array(list(TEST_INPUTS.values()), dtype=object)
+_TEST_INPUT_RULE_IDS = np.array([_RULE_INPUT_IDS.get(text, -1) for text in _TEST_INPUT_TEXTS])
+
+
 def apply_scenario_rules(
     input_text: str,
     factors: ContextFactors,
@@ -133,35 +382,21 @@ def apply_scenario_rules(
     
     Each rule explicitly handles a specific ambiguity case where context
     factors disambiguate between multiple valid interpretations.
+    Exact-match inputs are resolved through _RULE_TABLES; everything
+    else falls through to the slang and distortion checks.
     
     Returns:
         Tuple of (expected_intent, conflicting_intent)
     """
+    # RULES 1, 2, 4, 5, 6: exact-match inputs
+    rule = _RULE_TABLES.get(input_text)
+    if rule:
+        factor, outcomes, default = rule
+        return outcomes.get(getattr(factors, factor), default)
     
-    # RULE 1: Factor 1 - Association (History/Sahacarya)
-    if input_text == "Book it":
-        if factors.ctx_association == "travel_history":
-            return "book_flight", "reserve_table"
-        elif factors.ctx_association == "dining_history":
-            return "reserve_table", "book_flight"
-        elif factors.ctx_association == "shopping_history":
-            return "complete_purchase", "book_flight"
-        else:
-            return "booking_generic", "unknown_booking"
-    
-    # RULE 2: Factor 2 - Conflict Check (System State/Virodhitā)
-    if input_text == "Turn on lights":
-        if factors.ctx_conflict_check == "lights_already_on":
-            return "error_redundant_command", "turn_on_lights"
-        elif factors.ctx_conflict_check == "no_conflict":
-            return "turn_on_lights", "error_redundant_command"
-        else:
-            return "turn_on_lights", "error_conflict"
+    is_slang, distortion_intent = _scan_vocabulary(input_text)
     
     # RULE 3: Factor 7 - Social Mode (Propriety/Aucitī) - Slang Handling
-    slang_expressions = ["That's sick", "No cap", "That's lit", "No way"]
-    is_slang = any(slang in input_text for slang in slang_expressions)
-    
     if is_slang:
         if factors.ctx_social_mode == "Business":
             return "flagged_unprofessional", "sentiment_positive"
@@ -170,408 +405,296 @@ def apply_scenario_rules(
         else:
             return "sentiment_contextual", "flagged_unprofessional"
     
-    # RULE 4: Factor 8 - Location (Place/Deśa) - The "Bank" Problem
-    if input_text == "Go to the bank":
-        if factors.ctx_location == "Nature/Wilderness":
-            return "navigate_river_bank", "navigate_financial_bank"
-        elif factors.ctx_location == "City_Center":
-            return "navigate_financial_bank", "navigate_river_bank"
-        elif factors.ctx_location == "Home":
-            return "navigate_financial_bank", "navigate_river_bank"
-        else:
-            return "navigate_bank_ambiguous", "navigate_unknown"
-    
-    # RULE 5: Factor 9 - Time of Day (Time/Kāla)
-    if input_text == "Good morning":
-        if factors.ctx_time_of_day in ["23:00", "02:00"]:
-            return "greeting_correction", "greeting_appropriate"
-        elif factors.ctx_time_of_day in ["06:00", "08:00"]:
-            return "greeting_appropriate", "greeting_correction"
-        else:
-            return "greeting_contextual", "greeting_correction"
+    # RULE 7: Factor 12 - Fidelity + User Profile (Distortion/Apabhraṃśa)
+    if distortion_intent and (factors.ctx_fidelity < 0.5 or factors.ctx_user_profile == "Gen_Z"):
+        return distortion_intent, "unrecognized_command"
     
-    # RULE 6: Factor 11 - Intonation (Intonation/Svara)
-    if input_text == "Right":
-        if factors.ctx_intonation == "Rising":
-            return "confirm_query", "affirmation"
-        elif factors.ctx_intonation == "Flat":
-            return "affirmation", "confirm_query"
-        elif factors.ctx_intonation == "Questioning":
-            return "confirm_query", "affirmation"
-        else:
-            return "affirmation_neutral", "confirm_query"
+    # DEFAULT: Generic intent resolution based on frequency
+    return DEFAULT_INTENTS.get(input_text, GENERIC_OUTCOME)
+
+
+def _is_context_free(input_text: str) -> bool:
+    """True if apply_scenario_rules resolves input_text without reading any factor."""
+    return input_text not in _RULE_TABLES and not any(_scan_vocabulary(input_text))
+
+
+def generate_edge_case(edge_case_type: Optional[str] = None) -> Tuple[str, ContextFactors]:
+    """
+    Generate an edge case that triggers one of the scenario rules.
+    These are the "hard" disambiguation cases that test real ambiguity resolution.
     
-    # RULE 7: Factor 12 - Fidelity + User Profile (Distortion/Apabhraṃśa)
-    slang_map = {
-        "Wudder": "water_command",
-        "Wader": "water_command",
-        "Bet": "confirm_action",
-        "Fax": "confirm_action",
-        "Slay": "sentiment_positive",
-        "Bussin": "sentiment_positive"
+    Args:
+        edge_case_type: One of EDGE_CASE_TYPES (drawn at random if omitted)
+    """
+    if edge_case_type is None:
+        edge_case_type = random.choice(EDGE_CASE_TYPES)
+    
+    inputs, overrides = EDGE_CASE_SCENARIOS[edge_case_type]
+    factors = {
+        column: random.choice(values)
+        for column, values in FACTOR_CHOICES.items()
+        if column not in overrides
     }
+    for column, value in overrides.items():
+        factors[column] = random.choice(value) if isinstance(value, tuple) else value
     
-    if factors.ctx_fidelity < 0.5 or factors.ctx_user_profile == "Gen_Z":
-        for slang_input, corrected_intent in slang_map.items():
-            if slang_input.lower() in input_text.lower():
-                return corrected_intent, "unrecognized_command"
+    return random.choice(inputs), ContextFactors(**factors)
+
+
+def generate_ids(num_rows: int, rng: np.random.Generator) -> List[str]:
+    """
+    Generate unique row ids in one batch.
     
-    # DEFAULT: Generic intent resolution based on frequency
-    default_intents = {
-        "Wake me up": ("set_alarm", "wake_device"),
-        "Set an alarm for 7 AM": ("set_alarm", "schedule_reminder"),
-        "Play music": ("play_music", "play_audio"),
-        "Call mom": ("make_call", "send_message"),
-        "Order pizza": ("order_food", "search_restaurant"),
-        "What's the weather": ("get_weather", "open_weather_app"),
+    Draws distinct 63-bit integers without replacement and formats them as
+    16-digit hex strings, avoiding a uuid4() call per row.
+    """
+    return [f"{value:016x}" for value in rng.choice(2**63 - 1, size=num_rows, replace=False).tolist()]
+
+
+def generate_normal_cases(num_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Generate baseline test cases column-wise.
+    
+    Every ctx_* column is drawn as an integer code array in a single NumPy
+    call. Inputs covered by _RULE_TABLES are resolved in one fancy-index
+    into the flattened outcome table, and inputs whose outcome does not
+    depend on any factor are resolved once; only the rest go through
+    apply_scenario_rules row by row.
+    
+    Args:
+        num_rows: Number of normal test cases
+        rng: NumPy random generator used for all draws
+    
+    Returns:
+        DataFrame with the final dataset columns, minus "id"
+    """
+    input_codes = rng.integers(len(_TEST_INPUT_TEXTS), size=num_rows)
+    input_texts = _TEST_INPUT_TEXTS[input_codes]
+    factor_codes = np.stack([rng.integers(len(values), size=num_rows) for values in FACTOR_CHOICES.values()])
+    factor_columns = {
+        column: np.array(values, dtype=object)[codes]
+        for (column, values), codes in zip(FACTOR_CHOICES.items(), factor_codes)
     }
     
-    if input_text in default_intents:
-        return default_intents[input_text]
+    expected_intents = np.empty(num_rows, dtype=object)
+    conflicting_intents = np.empty(num_rows, dtype=object)
+    
+    # RULES 1, 2, 4, 5, 6: (input id << 4) | code of that input's factor
+    rule_ids = _TEST_INPUT_RULE_IDS[input_codes]
+    rows = np.flatnonzero(rule_ids >= 0)
+    keys = (rule_ids[rows] << 4) | factor_codes[_RULE_FACTOR_INDEX[rule_ids[rows]], rows]
+    expected_intents[rows] = _OUTCOME_EXPECTED[keys]
+    conflicting_intents[rows] = _OUTCOME_CONFLICTING[keys]
+    
+    per_row = []
+    for input_code in np.flatnonzero(_TEST_INPUT_RULE_IDS < 0):
+        input_text = _TEST_INPUT_TEXTS[input_code]
+        rows = np.flatnonzero(input_codes == input_code)
+        if _is_context_free(input_text):
+            expected_intents[rows], conflicting_intents[rows] = DEFAULT_INTENTS.get(
+                input_text, GENERIC_OUTCOME
+            )
+        else:
+            per_row.append(rows)
+    
+    rest = np.concatenate(per_row) if per_row else np.empty(0, dtype=np.intp)
+    for row, input_text, *factor_values in zip(
+        rest, input_texts[rest], *(column[rest] for column in factor_columns.values())
+    ):
+        expected_intents[row], conflicting_intents[row] = apply_scenario_rules(
+            input_text, ContextFactors(*factor_values)
+        )
     
-    return "generic_intent", "fallback_intent"
+    return pd.DataFrame({
+        "input_text": input_texts,
+        "expected_intent": expected_intents,
+        "conflicting_intent": conflicting_intents,
+        **factor_columns,
+    }).infer_objects()
 
 
-def generate_random_factors() -> ContextFactors:
-    """Generate random context factors (baseline case)."""
-    return ContextFactors(
-        ctx_association=random.choice(ASSOCIATIONS),
-        ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-        ctx_active_goal=random.choice(ACTIVE_GOALS),
-        ctx_screen_state=random.choice(SCREEN_STATES),
-        ctx_syntax_flag=random.choice(SYNTAX_FLAGS),
-        ctx_base_score=round(random.choice(BASE_SCORES), 2),
-        ctx_social_mode=random.choice(SOCIAL_MODES),
-        ctx_location=random.choice(LOCATIONS),
-        ctx_time_of_day=random.choice(TIME_OF_DAY),
-        ctx_user_profile=random.choice(USER_PROFILES),
-        ctx_intonation=random.choice(INTONATIONS),
-        ctx_fidelity=round(random.choice(FIDELITIES), 2),
-    )
+def generate_edge_cases(num_rows: int) -> pd.DataFrame:
+    """
+    Generate hard edge-case scenarios via generate_edge_case().
+    
+    Args:
+        num_rows: Number of edge cases
+    
+    Returns:
+        DataFrame with the final dataset columns, minus "id"
+    """
+    input_texts: List[str] = []
+    expected_intents: List[str] = []
+    conflicting_intents: List[str] = []
+    factor_rows: List[ContextFactors] = []
+    
+    for edge_case_type in random.choices(EDGE_CASE_TYPES, k=num_rows):
+        input_text, factors = generate_edge_case(edge_case_type)
+        expected_intent, conflicting_intent = apply_scenario_rules(input_text, factors)
+        
+        input_texts.append(input_text)
+        expected_intents.append(expected_intent)
+        conflicting_intents.append(conflicting_intent)
+        factor_rows.append(factors)
+    
+    return pd.DataFrame({
+        "input_text": input_texts,
+        "expected_intent": expected_intents,
+        "conflicting_intent": conflicting_intents,
+        **{column: list(map(attrgetter(column), factor_rows)) for column in FACTOR_CHOICES},
+    })
 
 
-def generate_edge_case() -> Tuple[str, ContextFactors]:
+def _generate_chunk(task: Tuple[str, int, np.random.SeedSequence]) -> pd.DataFrame:
     """
-    Generate an edge case that triggers one of the scenario rules.
-    These are the "hard" disambiguation cases that test real ambiguity resolution.
+    Generate one chunk of normal or edge cases (Pool worker entry point).
+    
+    Each chunk seeds both NumPy and the stdlib random module from its own
+    SeedSequence, so chunks are independent regardless of which process
+    generates them.
     """
-    edge_case_type = random.choice([
-        "book_it_travel",
-        "book_it_dining",
-        "turn_on_lights",
-        "slang_business",
-        "slang_casual",
-        "go_bank_nature",
-        "go_bank_city",
-        "good_morning_night",
-        "good_morning_morning",
-        "right_rising",
-        "right_flat",
-        "distortion_low_fidelity",
-        "distortion_gen_z",
-    ])
-    
-    if edge_case_type == "book_it_travel":
-        factors = ContextFactors(
-            ctx_association="travel_history",
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal="book_travel",
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="command",
-            ctx_base_score=0.95,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.95,
-        )
-        return "Book it", factors
-    
-    elif edge_case_type == "book_it_dining":
-        factors = ContextFactors(
-            ctx_association="dining_history",
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state="on_restaurant_app",
-            ctx_syntax_flag="command",
-            ctx_base_score=0.95,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location="Restaurant",
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.95,
-        )
-        return "Book it", factors
-    
-    elif edge_case_type == "turn_on_lights":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check="lights_already_on",
-            ctx_active_goal="control_home",
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="command",
-            ctx_base_score=0.8,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location="Home",
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation="Emphatic",
-            ctx_fidelity=0.95,
-        )
-        return "Turn on lights", factors
-    
-    elif edge_case_type == "slang_business":
-        slang = random.choice(["That's sick", "No cap"])
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state="on_home_screen",
-            ctx_syntax_flag="statement",
-            ctx_base_score=0.7,
-            ctx_social_mode="Business",
-            ctx_location="Office",
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.85,
-        )
-        return slang, factors
-    
-    elif edge_case_type == "slang_casual":
-        slang = random.choice(["That's sick", "No cap"])
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="statement",
-            ctx_base_score=0.7,
-            ctx_social_mode="Casual",
-            ctx_location=random.choice(["Home", "Car"]),
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.85,
-        )
-        return slang, factors
-    
-    elif edge_case_type == "go_bank_nature":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state="on_map_app",
-            ctx_syntax_flag="command",
-            ctx_base_score=0.8,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location="Nature/Wilderness",
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation="Flat",
-            ctx_fidelity=0.95,
-        )
-        return "Go to the bank", factors
-    
-    elif edge_case_type == "go_bank_city":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state="on_banking_app",
-            ctx_syntax_flag="command",
-            ctx_base_score=0.8,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location="City_Center",
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation="Flat",
-            ctx_fidelity=0.95,
-        )
-        return "Go to the bank", factors
-    
-    elif edge_case_type == "good_morning_night":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="greeting",
-            ctx_base_score=0.6,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day="23:00",
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.95,
-        )
-        return "Good morning", factors
-    
-    elif edge_case_type == "good_morning_morning":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="greeting",
-            ctx_base_score=0.6,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day="06:00",
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.95,
-        )
-        return "Good morning", factors
-    
-    elif edge_case_type == "right_rising":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="question",
-            ctx_base_score=0.8,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation="Rising",
-            ctx_fidelity=0.95,
-        )
-        return "Right", factors
-    
-    elif edge_case_type == "right_flat":
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag="statement",
-            ctx_base_score=0.8,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation="Flat",
-            ctx_fidelity=0.95,
-        )
-        return "Right", factors
-    
-    elif edge_case_type == "distortion_low_fidelity":
-        slang = random.choice(["Wudder", "Bet", "Slay"])
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag=random.choice(SYNTAX_FLAGS),
-            ctx_base_score=0.3,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile=random.choice(USER_PROFILES),
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.3,
-        )
-        return slang, factors
-    
-    else:  # distortion_gen_z
-        slang = random.choice(["Wudder", "Bet", "Slay"])
-        factors = ContextFactors(
-            ctx_association=random.choice(ASSOCIATIONS),
-            ctx_conflict_check=random.choice(CONFLICT_CHECKS),
-            ctx_active_goal=random.choice(ACTIVE_GOALS),
-            ctx_screen_state=random.choice(SCREEN_STATES),
-            ctx_syntax_flag=random.choice(SYNTAX_FLAGS),
-            ctx_base_score=0.8,
-            ctx_social_mode=random.choice(SOCIAL_MODES),
-            ctx_location=random.choice(LOCATIONS),
-            ctx_time_of_day=random.choice(TIME_OF_DAY),
-            ctx_user_profile="Gen_Z",
-            ctx_intonation=random.choice(INTONATIONS),
-            ctx_fidelity=0.7,
-        )
-        return slang, factors
+    kind, count, seed = task
+    random.seed(int(seed.generate_state(1)[0]))
+    if kind == "edge":
+        return generate_edge_cases(count)
+    return generate_normal_cases(count, np.random.default_rng(seed))
+
+
+def iter_dataset_chunks(
+    num_rows: int = 10000,
+    edge_case_ratio: float = 0.2,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    verbose: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Generate the test dataset as a sequence of bounded-size chunks.
+    
+    All normal cases come first, followed by all edge cases, so the
+    concatenated chunks keep the same row order as a single frame.
+    
+    Args:
+        num_rows: Total number of test cases (default 10,000)
+        edge_case_ratio: Fraction of rows that should be edge cases (default 0.2 = 20%)
+        chunk_size: Maximum rows per yielded chunk
+        workers: Number of processes generating chunks (1 = in-process)
+        verbose: Print a progress line after every chunk
+    
+    Yields:
+        DataFrames of at most chunk_size rows, with the string ctx_*
+        columns stored as Categoricals
+    """
+    num_edge_cases = int(num_rows * edge_case_ratio)
+    num_normal_cases = num_rows - num_edge_cases
+    totals = {"normal": num_normal_cases, "edge": num_edge_cases}
+    
+    plan = [
+        (kind, min(chunk_size, total - start))
+        for kind, total in totals.items()
+        for start in range(0, total, chunk_size)
+    ]
+    seeds = np.random.SeedSequence().spawn(len(plan) + 1)
+    tasks = [(kind, count, seed) for (kind, count), seed in zip(plan, seeds)]
+    ids = iter(generate_ids(num_rows, np.random.default_rng(seeds[-1])))
+    
+    print(f"\n🧮 Generating {num_normal_cases:,} normal test cases...")
+    done = {"normal": 0, "edge": 0}
+    with Pool(workers) if workers > 1 else nullcontext() as pool:
+        chunks = pool.imap(_generate_chunk, tasks) if pool else map(_generate_chunk, tasks)
+        for (kind, count, _), chunk in zip(tasks, chunks):
+            if kind == "edge" and done["edge"] == 0:
+                print(f"\n🔥 Generating {num_edge_cases:,} hard edge case scenarios...")
+            
+            chunk.insert(0, "id", list(islice(ids, count)))
+            yield chunk.astype(CATEGORY_DTYPES)
+            
+            done[kind] += count
+            if verbose:
+                label = "cases" if kind == "normal" else "edge cases"
+                print(f"   ✓ {done[kind]:,}/{totals[kind]:,} {label} generated")
 
 
 def generate_dataset(num_rows: int = 10000, edge_case_ratio: float = 0.2) -> pd.DataFrame:
     """
-    Generate the full test dataset with logical consistency.
+    Generate the full test dataset in memory.
     
     Args:
         num_rows: Total number of test cases (default 10,000)
         edge_case_ratio: Fraction of rows that should be edge cases (default 0.2 = 20%)
     
     Returns:
-        DataFrame ready to be saved as CSV
+        DataFrame ready to be saved as CSV, with the string ctx_* columns
+        stored as Categoricals
     """
-    num_edge_cases = int(num_rows * edge_case_ratio)
-    num_normal_cases = num_rows - num_edge_cases
+    chunks = iter_dataset_chunks(num_rows, edge_case_ratio, chunk_size=max(num_rows, 1))
+    return pd.concat(chunks, ignore_index=True)
+
+
+# Unquoted values and header, so both writers produce the same bytes
+_ARROW_WRITE_OPTIONS = (
+    pacsv.WriteOptions(quoting_style="none", quoting_header="none") if pa is not None else None
+)
+
+
+def write_dataset(
+    output_path: Path,
+    num_rows: int = 10000,
+    edge_case_ratio: float = 0.2,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    verbose: bool = False,
+) -> None:
+    """
+    Stream the test dataset to CSV one chunk at a time.
     
-    rows = []
+    Peak memory is bounded by chunk_size rather than the full dataset.
+    Chunks are generated by `workers` processes and written in order.
+    Uses PyArrow's multithreaded C++ CSV writer when pyarrow is installed,
+    otherwise DataFrame.to_csv.
+    """
+    chunks = iter_dataset_chunks(num_rows, edge_case_ratio, chunk_size, workers, verbose)
+    
+    if pa is None:
+        # No generated value contains a delimiter or quote character, so the
+        # per-field quoting check can be skipped entirely
+        with output_path.open("w", newline="") as f:
+            for i, chunk in enumerate(chunks):
+                chunk.to_csv(
+                    f,
+                    header=(i == 0),
+                    index=False,
+                    lineterminator="\n",
+                    quoting=csv.QUOTE_NONE,
+                    escapechar="\\",
+                )
+        return
+    
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pacsv.CSVWriter(str(output_path), table.schema, write_options=_ARROW_WRITE_OPTIONS)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def load_dataset(path: Path) -> pd.DataFrame:
+    """
+    Read a generated dataset back for analysis.
     
-    print(f"\n🧮 Generating {num_normal_cases:,} normal test cases...")
-    for i in range(num_normal_cases):
-        if (i + 1) % 2000 == 0:
-            print(f"   ✓ {i + 1:,}/{num_normal_cases:,} cases generated")
-        
-        input_text = random.choice(list(TEST_INPUTS.values()))
-        factors = generate_random_factors()
-        expected_intent, conflicting_intent = apply_scenario_rules(input_text, factors)
-        
-        row = {
-            "id": str(uuid.uuid4()),
-            "input_text": input_text,
-            "expected_intent": expected_intent,
-            "conflicting_intent": conflicting_intent,
-            "ctx_association": factors.ctx_association,
-            "ctx_conflict_check": factors.ctx_conflict_check,
-            "ctx_active_goal": factors.ctx_active_goal,
-            "ctx_screen_state": factors.ctx_screen_state,
-            "ctx_syntax_flag": factors.ctx_syntax_flag,
-            "ctx_base_score": factors.ctx_base_score,
-            "ctx_social_mode": factors.ctx_social_mode,
-            "ctx_location": factors.ctx_location,
-            "ctx_time_of_day": factors.ctx_time_of_day,
-            "ctx_user_profile": factors.ctx_user_profile,
-            "ctx_intonation": factors.ctx_intonation,
-            "ctx_fidelity": factors.ctx_fidelity,
-        }
-        rows.append(row)
-    
-    print(f"\n🔥 Generating {num_edge_cases:,} hard edge case scenarios...")
-    for i in range(num_edge_cases):
-        if (i + 1) % 500 == 0:
-            print(f"   ✓ {i + 1:,}/{num_edge_cases:,} edge cases generated")
-        
-        input_text, factors = generate_edge_case()
-        expected_intent, conflicting_intent = apply_scenario_rules(input_text, factors)
-        
-        row = {
-            "id": str(uuid.uuid4()),
-            "input_text": input_text,
-            "expected_intent": expected_intent,
-            "conflicting_intent": conflicting_intent,
-            "ctx_association": factors.ctx_association,
-            "ctx_conflict_check": factors.ctx_conflict_check,
-            "ctx_active_goal": factors.ctx_active_goal,
-            "ctx_screen_state": factors.ctx_screen_state,
-            "ctx_syntax_flag": factors.ctx_syntax_flag,
-            "ctx_base_score": factors.ctx_base_score,
-            "ctx_social_mode": factors.ctx_social_mode,
-            "ctx_location": factors.ctx_location,
-            "ctx_time_of_day": factors.ctx_time_of_day,
-            "ctx_user_profile": factors.ctx_user_profile,
-            "ctx_intonation": factors.ctx_intonation,
-            "ctx_fidelity": factors.ctx_fidelity,
-        }
-        rows.append(row)
-    
-    df = pd.DataFrame(rows)
-    return df
+    Every string column except "id" is loaded as a Categorical, so the
+    nunique/value_counts calls in print_statistics work on integer codes.
+    """
+    dtypes = {
+        **CATEGORY_DTYPES,
+        "input_text": "category",
+        "expected_intent": "category",
+        "conflicting_intent": "category",
+    }
+    return pd.read_csv(path, dtype=dtypes, keep_default_na=False)
 
 
 def print_statistics(df: pd.DataFrame) -> None:
@@ -613,13 +736,19 @@ def print_statistics(df: pd.DataFrame) -> None:
         "navigate_river_bank", "navigate_financial_bank",
         "greeting_correction", "confirm_query", "affirmation"
     ]
-    hard_cases = df[df['expected_intent'].isin(hard_scenario_keywords)].shape[0]
+    hard_cases = int(df['expected_intent'].isin(hard_scenario_keywords).sum())
     print(f"   - Hard scenarios: {hard_cases:,} rows ({100*hard_cases/len(df):.1f}%)")
     print("="*80 + "\n")
 
 
-def main():
-    """Main execution - generate and save the dataset."""
+def main(verbose: bool = False, workers: int = 1):
+    """
+    Main execution - generate and save the dataset.
+    
+    Args:
+        verbose: Print per-chunk progress while generating
+        workers: Number of processes generating chunks (1 = in-process)
+    """
     print("\n" + "=" * 80)
     print("🚀 12-FACTOR CONTEXT ENGINE - TEST DATA GENERATOR")
     print("=" * 80)
@@ -629,6 +758,7 @@ def main():
     print(f"   • Normal cases: 8,000 (80%)")
     print(f"   • Edge cases (hard scenarios): 2,000 (20%)")
     print(f"   • Output: data/context_test_data_large.csv")
+    print(f"   • Worker processes: {workers}")
     print()
     print("🎯 Deterministic Scenarios (If-Then Logic):")
     print("   1. 'Book it' - FACTOR 1: Association (travel → book_flight, dining → reserve_table)")
@@ -641,19 +771,17 @@ def main():
     print()
     print("=" * 80)
     
-    # Generate dataset
-    df = generate_dataset(num_rows=10000, edge_case_ratio=0.2)
-    
-    # Print statistics
-    print_statistics(df)
-    
     # Ensure output directory exists
     output_path = Path("data/context_test_data_large.csv")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Save to CSV
-    print(f"💾 Saving dataset to {output_path}...")
-    df.to_csv(output_path, index=False)
+    # Generate dataset straight to CSV
+    print(f"💾 Streaming dataset to {output_path}...")
+    write_dataset(output_path, num_rows=10000, edge_case_ratio=0.2, workers=workers, verbose=verbose)
+    
+    # Print statistics
+    df = load_dataset(output_path)
+    print_statistics(df)
     
     file_size_mb = output_path.stat().st_size / (1024 * 1024)
     print(f"✅ SUCCESS!")
@@ -673,3 +801,11 @@ def main():
     print("\n" + "=" * 80)
     print("✨ Dataset ready for stress testing!")
     print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the 12-factor context test dataset")
+    parser.add_argument("--verbose", action="store_true", help="print per-chunk progress while generating")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes generating chunks (default: 1, in-process)")
+    args = parser.parse_args()
+    main(verbose=args.verbose, workers=args.workers)
@@ -1,96 +1,213 @@
 """
 Final validation - check all components work together
+
+Usage:
+    python scripts/validate_all.py                    # Run every check
+    python scripts/validate_all.py --fast             # Skip the engine checks (no model load)
+    python scripts/validate_all.py --quiet            # Only print the timing summary
+    python scripts/validate_all.py --json             # Emit the timing summary as JSON
+    python scripts/validate_all.py --check-streamlit  # Also check the Streamlit import
 """
+import argparse
+import json
 import sys
+import time
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+QUIET = False
 
-sys.path.insert(0, str(Path(__file__).parent))
 
-print("🔍 Validating Sphota AI Components...")
-print()
+def say(message: str = "") -> None:
+    """Print progress output unless --quiet/--json was given."""
+    if not QUIET:
+        print(message)
+
 
 # Test 1: Core imports
-print("1️⃣ Testing core imports...")
-from core import PasyantiEngine, ContextResolutionMatrix, ContextObject, ApabhramsaLayer
-print("   ✅ Core imports successful")
+def check_core_imports(state: Dict[str, Any]) -> None:
+    say("1️⃣ Testing core imports...")
+    import core
+    from core import IntentEngine, ContextResolutionMatrix, ContextObject, NormalizationLayer
+    state["core"] = core
+    say("   ✅ Core imports successful")
+
 
 # Test 2: CRM initialization
-print("2️⃣ Testing CRM initialization...")
-crm = ContextResolutionMatrix()
-assert len(crm.weights) == 12
-print(f"   ✅ CRM initialized with {len(crm.weights)} factors")
-
-# Test 3: Apabhramsa
-print("3️⃣ Testing Apabhramsa layer...")
-apabhramsa = ApabhramsaLayer()
-normalized, score = apabhramsa.normalize_to_pure_form("yo wassup")
-print(f"   ✅ Apabhramsa working (distortion: {score:.2f})")
-
-# Test 4: PasyantiEngine
-print("4️⃣ Testing PasyantiEngine...")
-try:
-    from unittest.mock import Mock, MagicMock, patch
+def check_crm(state: Dict[str, Any]) -> None:
+    say("2️⃣ Testing CRM initialization...")
+    crm = state["core"].ContextResolutionMatrix()
+    assert len(crm.weights) == 12
+    say(f"   ✅ CRM initialized with {len(crm.weights)} factors")
+
+
+# Test 3: Normalization
+def check_normalization(state: Dict[str, Any]) -> None:
+    say("3️⃣ Testing Normalization layer...")
+    normalization = state["core"].NormalizationLayer()
+    normalized, score = normalization.normalize_to_pure_form("yo wassup")
+    say(f"   ✅ Normalization working (distortion: {score:.2f})")
+
+
+# Test 4: IntentEngine
+def check_engine(state: Dict[str, Any]) -> None:
+    say("4️⃣ Testing IntentEngine...")
+    from unittest.mock import patch
     import numpy as np
-    
-    mock_model = MagicMock()
-    def mock_encode(texts, **kwargs):
-        if isinstance(texts, str):
-            texts = [texts]
-        embeddings = []
-        for text in texts:
-            seed = hash(text) % 10000
-            np.random.seed(seed)
-            embedding = np.random.randn(384)
-            embedding = embedding / np.linalg.norm(embedding)
-            embeddings.append(embedding)
-        return np.array(embeddings)
-    
-    mock_model.encode = Mock(side_effect=mock_encode)
-    
-    with patch('core.pasyanti_engine.SentenceTransformer', return_value=mock_model):
-        engine = PasyantiEngine(intents_path="data/intents.json")
-        print(f"   ✅ Engine loaded with {len(engine.intents)} intents")
-        
-        # Test 5: Intent resolution
-        print("5️⃣ Testing intent resolution...")
-        context = ContextObject(desa="city", sahacarya=["money"])
-        results = engine.resolve_intent("take me to the bank", context)
-        print(f"   ✅ Resolution works: Winner = {results[0].intent.id}")
-        
-        # Test 6: Dict context support
-        print("6️⃣ Testing Dict context support...")
-        context_dict = {"desa": "nature", "sahacarya": ["fishing"]}
-        results2 = engine.resolve_intent("take me to the bank", context_dict)
-        print(f"   ✅ Dict context works: Winner = {results2[0].intent.id}")
-        
-        # Test 7: Explanation
-        print("7️⃣ Testing explain_resolution...")
-        explanation = engine.explain_resolution("test input", context)
-        assert "input" in explanation
-        assert "context" in explanation
-        assert "resolution" in explanation
-        print(f"   ✅ Explanation generated with {len(explanation)} keys")
-
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+
+    class _StubSentenceTransformer:
+        """Plain stand-in for SentenceTransformer with deterministic embeddings."""
+
+        def __init__(self):
+            self.calls = 0
+
+        def encode(self, texts, **kwargs):
+            self.calls += 1
+            if isinstance(texts, str):
+                # Like SentenceTransformer, a single string gives one 1-D vector
+                return self.encode([texts], **kwargs)[0]
+            # A private generator per text keeps each vector deterministic
+            # without reseeding NumPy's global RNG
+            embeddings = np.stack([
+                np.random.default_rng(hash(text) % 10000).standard_normal(384)
+                for text in texts
+            ])
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+            return embeddings
+
+    stub_model = _StubSentenceTransformer()
+
+    with patch('core.intent_engine.SentenceTransformer', return_value=stub_model):
+        engine = state["core"].IntentEngine(intents_path=str(ROOT / "data" / "intents.json"), use_fast_memory=False)
+    state["engine"] = engine
+    say(f"   ✅ Engine loaded with {len(engine.intents)} intents")
+
+
+# Test 5: Intent resolution
+def check_resolution(state: Dict[str, Any]) -> None:
+    say("5️⃣ Testing intent resolution...")
+    context = state["core"].ContextObject(location="city", history=["money"])
+    results = state["engine"].resolve_intent("take me to the bank", context)
+    state["context"] = context
+    say(f"   ✅ Resolution works: Winner = {results[0].intent.id}")
+
+
+# Test 6: Dict context support
+def check_dict_context(state: Dict[str, Any]) -> None:
+    say("6️⃣ Testing Dict context support...")
+    context_dict = {"location": "nature", "history": ["fishing"]}
+    results2 = state["engine"].resolve_intent("take me to the bank", context_dict)
+    say(f"   ✅ Dict context works: Winner = {results2[0].intent.id}")
+
+
+# Test 7: Explanation
+def check_explanation(state: Dict[str, Any]) -> None:
+    say("7️⃣ Testing explain_resolution...")
+    explanation = state["engine"].explain_resolution("test input", state["context"])
+    assert "input" in explanation
+    assert "context" in explanation
+    assert "resolution" in explanation
+    say(f"   ✅ Explanation generated with {len(explanation)} keys")
+
 
 # Test 8: Streamlit app imports
-print("8️⃣ Testing Streamlit app compatibility...")
-try:
-    import streamlit
-    print(f"   ✅ Streamlit {streamlit.__version__} available")
-except ImportError:
-    print("   ⚠️  Streamlit not in this environment (but available in venv)")
-
-print()
-print("=" * 50)
-print("✅ ALL VALIDATIONS PASSED!")
-print("=" * 50)
-print()
-print("📝 Next steps:")
-print("   • Run tests: .venv/Scripts/python.exe -m pytest tests/test_sphota.py -v")
-print("   • Run app: .venv/Scripts/python.exe -m streamlit run app.py")
-print()
+def check_streamlit(state: Dict[str, Any]) -> None:
+    say("8️⃣ Testing Streamlit app compatibility...")
+    try:
+        import streamlit
+        say(f"   ✅ Streamlit {streamlit.__version__} available")
+    except ImportError:
+        say("   ⚠️  Streamlit not in this environment (but available in venv)")
+
+
+def build_steps(args: argparse.Namespace) -> List[Tuple[str, Callable[[Dict[str, Any]], None]]]:
+    """Select the validation steps for the given command-line options."""
+    steps: List[Tuple[str, Callable[[Dict[str, Any]], None]]] = [
+        ("core_imports", check_core_imports),
+        ("crm", check_crm),
+        ("normalization", check_normalization),
+    ]
+
+    if args.fast:
+        say("⏩ --fast: skipping engine checks 4-7")
+    else:
+        steps += [
+            ("engine", check_engine),
+            ("resolution", check_resolution),
+            ("dict_context", check_dict_context),
+            ("explanation", check_explanation),
+        ]
+
+    if args.check_streamlit:
+        steps.append(("streamlit", check_streamlit))
+
+    return steps
+
+
+def main() -> int:
+    global QUIET
+
+    parser = argparse.ArgumentParser(description="Validate that all Sphota AI components work together")
+    parser.add_argument("--fast", action="store_true", help="skip the engine checks (no model load)")
+    parser.add_argument("--quiet", action="store_true", help="only print the timing summary")
+    parser.add_argument("--json", action="store_true", help="print the timing summary as JSON")
+    parser.add_argument("--check-streamlit", action="store_true", help="also check the Streamlit import")
+    args = parser.parse_args()
+
+    QUIET = args.quiet or args.json
+
+    say("🔍 Validating Sphota AI Components...")
+    say()
+
+    state: Dict[str, Any] = {}
+    timings: List[Dict[str, Any]] = []
+    failed = False
+
+    for name, step in build_steps(args):
+        start = time.perf_counter_ns()
+        try:
+            step(state)
+            passed = True
+        except Exception as e:
+            passed = False
+            if not args.json:
+                print(f"   ❌ Error: {e}")
+                import traceback
+                traceback.print_exc()
+
+        timings.append({"name": name, "passed": passed, "duration_ns": time.perf_counter_ns() - start})
+        if not passed:
+            failed = True
+            break
+
+    if args.json:
+        json.dump({"passed": not failed, "steps": timings}, sys.stdout)
+        print()
+        return 1 if failed else 0
+
+    if args.quiet:
+        for timing in timings:
+            status = "ok" if timing["passed"] else "FAILED"
+            print(f"{timing['name']:<14} {status:<6} {timing['duration_ns'] / 1e6:9.2f} ms")
+
+    if failed:
+        return 1
+
+    say()
+    say("=" * 50)
+    say("✅ ALL VALIDATIONS PASSED!")
+    say("=" * 50)
+    say()
+    say("📝 Next steps:")
+    say("   • Run tests: .venv/Scripts/python.exe -m pytest tests/test_sphota.py -v")
+    say("   • Run app: .venv/Scripts/python.exe -m streamlit run app.py")
+    say()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
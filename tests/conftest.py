@@ -0,0 +1,76 @@
+"""
+Shared pytest fixtures.
+
+Objects that are expensive to build and not mutated by tests are created
+once per session and reused by every test that requests them.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+try:
+    import orjson  # Parses the UTF-8 bytes directly; falls back to the stdlib
+except ImportError:
+    orjson = None
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(scope="session")
+def intent_engine():
+    """One IntentEngine (SBERT model + corpus embeddings) for the whole session."""
+    from core.intent_engine import IntentEngine
+    return IntentEngine(use_fast_memory=False)
+
+
+@pytest.fixture(scope="session")
+def weighter():
+    """ContextWeighter holds no per-call state, so one instance serves every test."""
+    from core.context_weighter import ContextWeighter
+    return ContextWeighter()
+
+
+@pytest.fixture(scope="session")
+def context_mgr():
+    """
+    One ContextManager for the whole session.
+    
+    calculate_confidence only reads its arguments, so scoring tests share
+    it as-is; _reset_context_mgr empties the command history before each
+    test that uses it. Scores are deliberately not memoized: building a
+    hashable key from an intent and context costs more (~7.1us) than the
+    scoring it would skip (~2.1us), and Factor 9 reads the wall-clock hour
+    when the context has no current_hour.
+    """
+    from core.context_manager import ContextManager
+    return ContextManager()
+
+
+@pytest.fixture(autouse=True)
+def _reset_context_mgr(request: pytest.FixtureRequest) -> None:
+    """Give every test that uses context_mgr an empty command history."""
+    if "context_mgr" in request.fixturenames:
+        request.getfixturevalue("context_mgr").clear_command_history()
+
+
+@pytest.fixture(scope="session")
+def intent_db() -> Dict[str, Any]:
+    """data/intent_db.json, read and parsed once per session."""
+    intent_db_path = project_root / "data" / "intent_db.json"
+    try:
+        raw = intent_db_path.read_bytes()
+    except FileNotFoundError:
+        pytest.fail(f"Intent database not found: {intent_db_path}")
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@pytest.fixture(scope="session")
+def intent_by_id(intent_db: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """intent_db intents indexed by intent_id."""
+    return {intent['intent_id']: intent for intent in intent_db['intents'] if 'intent_id' in intent}
@@ -6,15 +6,26 @@ This script demonstrates how to test the /resolve-intent endpoint
 with various context scenarios.
 
 Usage:
-    python test_api.py
+    python test_api.py          # Against a running server
+    python test_api.py --mock   # Fully in-process with canned responses (CI)
+    pytest tests/test_api.py    # Under pytest, always against the mock transport
 
 Requirements:
     pip install httpx
+    pip install uvloop        # Optional, faster event loop (POSIX only)
+    pip install httpx[http2]  # Optional, HTTP/2 multiplexing behind a TLS proxy
 """
 
+import argparse
 import asyncio
+import io
 import json
+import sys
+from contextvars import ContextVar
 from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+import pytest
 
 try:
     import httpx
@@ -22,40 +33,315 @@ except ImportError:
     print("ERROR: httpx not installed. Run: pip install httpx")
     exit(1)
 
+try:
+    import h2  # noqa: F401  # httpx[http2] extra; enables HTTP/2 in the client
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson  # Faster JSON parsing/printing; falls back to the stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # libuv event loop; ships with uvicorn[standard] on POSIX
+except ImportError:
+    uvloop = None
+
 
 BASE_URL = "http://localhost:8000"
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def _pretty(obj: Any) -> str:
+    """Serialize obj to indented JSON for printing."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Request bodies are static, so they are serialized once. Scenario 1's
+# timestamp is filled in per run by replacing the __TS__ placeholder.
+SCENARIO_1_PAYLOAD = _dumps({
+    "command_text": "take me to the bank",
+    "context": {
+        "location_context": "manhattan",
+        "temporal_context": "__TS__",
+        "user_profile": "analyst",
+        "association_history": ["viewed_portfolio", "paid_bill"],
+        "goal_alignment": "finance"
+    }
+})
+
+SCENARIO_2_PAYLOAD = _dumps({
+    "command_text": "take me to the bank",
+    "context": {
+        "location_context": "nature_reserve",
+        "situation_context": "outdoor_hiking",
+        "association_history": ["fishing", "outdoor_gear", "trail_maps"],
+        "goal_alignment": "recreation",
+        "input_fidelity": 0.95
+    }
+})
+
+MINIMAL_PAYLOAD = _dumps({
+    "command_text": "set a 5 minute timer",
+    "context": {}
+})
+
+ERROR_PAYLOAD = _dumps({
+    "command_text": "turn on the lights",
+    "context": {
+        "semantic_capacity": 1.5,  # Invalid: > 1.0
+    }
+})
+
+
+# Canned bodies served by the --mock transport, keyed by (method, path)
+_MOCK_RESOLUTION = {
+    "resolved_intent": "navigate_to_financial_institution",
+    "confidence_score": 0.91,
+    "contributing_factors": [
+        {"factor_name": "location_context", "delta": 0.18, "influence": "boost"},
+        {"factor_name": "goal_alignment", "delta": 0.12, "influence": "boost"}
+    ],
+    "alternative_intents": {"navigate_to_river_bank": 0.22},
+    "action_payload": {
+        "intent_category": "navigate",
+        "intent_type": "navigate_to_financial_institution",
+        "requires_confirmation": False
+    },
+    "audit_trail": {
+        "active_factors": ["location_context", "goal_alignment"],
+        "all_scores": {"navigate_to_financial_institution": 0.91, "navigate_to_river_bank": 0.22}
+    },
+    "processing_time_ms": 0.0
+}
+
+_MOCK_RESPONSES = {
+    ("GET", "/health"): {"status": "healthy", "version": "1.0.0-beta", "engine_loaded": True},
+    ("GET", "/factors"): {
+        "factors": {
+            "association_history": {"weight": 0.15},
+            "conflict_markers": {"weight": 0.10},
+            "goal_alignment": {"weight": 0.20}
+        },
+        "total_factors": 12,
+        "total_weight": 1.5
+    },
+    ("POST", "/resolve-intent"): _MOCK_RESOLUTION,
+}
+
+_MOCK_VALIDATION_ERROR = {
+    "detail": [{
+        "type": "less_than_equal",
+        "loc": ["body", "context", "semantic_capacity"],
+        "msg": "Input should be less than or equal to 1"
+    }]
+}
+
+
+def _mock_handler(request: httpx.Request) -> httpx.Response:
+    """MockTransport handler answering the suite's requests without a server."""
+    key = (request.method, request.url.path)
+    if key == ("POST", "/resolve-intent/batch"):
+        count = len(_loads(request.content)["requests"])
+        return httpx.Response(200, content=_dumps({"results": [_MOCK_RESOLUTION] * count}), headers=JSON_HEADERS)
+    if key == ("POST", "/resolve-intent") and request.content == ERROR_PAYLOAD:
+        return httpx.Response(422, content=_dumps(_MOCK_VALIDATION_ERROR), headers=JSON_HEADERS)
+    if key not in _MOCK_RESPONSES:
+        return httpx.Response(404, content=_dumps({"detail": "Not Found"}), headers=JSON_HEADERS)
+    return httpx.Response(200, content=_dumps(_MOCK_RESPONSES[key]), headers=JSON_HEADERS)
+
+
+# Per-task output buffer; each gathered test sets its own
+_task_output: ContextVar[Optional[io.StringIO]] = ContextVar("_task_output", default=None)
+
+
+class _TaskStdout:
+    """sys.stdout proxy that routes prints from a running test into its own buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        return (_task_output.get() or self._stream).write(text)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+async def _run_captured(
+    test: Callable[[httpx.AsyncClient], Awaitable[None]],
+    client: httpx.AsyncClient
+) -> Tuple[str, Optional[Exception]]:
+    """Run one test with its output captured, returning (output, error)."""
+    buffer = io.StringIO()
+    _task_output.set(buffer)  # Only visible inside this task's context
+    try:
+        await test(client)
+    except Exception as e:
+        return buffer.getvalue(), e
+    return buffer.getvalue(), None
+
+
+class _IntentBatcher:
+    """
+    Coalesces concurrent /resolve-intent calls into /resolve-intent/batch POSTs.
+    
+    Calls queue up until max_batch_size are waiting or max_wait seconds pass,
+    then go out as one request; each caller gets back an httpx.Response for
+    its own item. If the server has no batch endpoint, or rejects a batch,
+    the queued calls are sent individually instead.
+    """
+    
+    def __init__(self, client: httpx.AsyncClient, max_batch_size: int = 16, max_wait: float = 0.05):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batch_supported = True
+        self._pending: List[Tuple[bytes, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only holds weak references to tasks, so in-flight sends
+        # are kept here until they finish
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def resolve(self, payload: bytes) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, batch: List[Tuple[bytes, asyncio.Future]]) -> None:
+        try:
+            if self.batch_supported and len(batch) > 1:
+                # Splice the pre-serialized bodies into the batch envelope
+                body = b'{"requests":[' + b",".join(payload for payload, _ in batch) + b"]}"
+                response = await self.client.post("/resolve-intent/batch", content=body, headers=JSON_HEADERS)
+                if response.status_code == 200:
+                    for (_, future), result in zip(batch, _loads(response.content)["results"]):
+                        future.set_result(httpx.Response(
+                            200,
+                            content=_dumps(result),
+                            headers=JSON_HEADERS
+                        ))
+                    return
+                if response.status_code in (404, 405):
+                    self.batch_supported = False
+            
+            # No batch endpoint, or the batch was rejected: one POST per item
+            responses = await asyncio.gather(*(
+                self.client.post("/resolve-intent", content=payload, headers=JSON_HEADERS)
+                for payload, _ in batch
+            ))
+            for (_, future), response in zip(batch, responses):
+                future.set_result(response)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
 
-async def test_health_check():
+# Set by main() so concurrently running scenarios share batched POSTs
+_batcher: Optional[_IntentBatcher] = None
+
+
+async def _post_resolve(client: httpx.AsyncClient, payload: bytes) -> httpx.Response:
+    """POST one serialized /resolve-intent body, through the batcher when one is running."""
+    if _batcher is not None and _batcher.client is client:
+        return await _batcher.resolve(payload)
+    return await client.post("/resolve-intent", content=payload, headers=JSON_HEADERS)
+
+
+def make_client(base_url: str = BASE_URL, mock: bool = False) -> httpx.AsyncClient:
+    """
+    Build the suite's pooled client.
+    
+    One client serves the whole suite so keep-alive connections are reused
+    instead of opening a new connection per request. HTTP/2 is negotiated
+    over TLS (e.g. an https:// proxy in front of uvicorn) and multiplexes
+    the concurrent tests on one connection; plain http:// to uvicorn stays
+    on HTTP/1.1 keep-alive.
+    """
+    return httpx.AsyncClient(
+        base_url=base_url,
+        http2=HTTP2_AVAILABLE,
+        transport=httpx.MockTransport(_mock_handler) if mock else None,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=10.0
+    )
+
+
+@pytest.fixture
+def anyio_backend():
+    """The suite's batcher and output capture are built on asyncio."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    """Pooled client on the mock transport, so pytest needs no running server."""
+    async with make_client(mock=True) as client:
+        yield client
+
+
+@pytest.mark.anyio
+async def test_health_check(client: httpx.AsyncClient):
     """Test the /health endpoint."""
     print("\n" + "="*70)
     print("TEST 1: Health Check")
     print("="*70)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/health")
-        print(f"Status: {response.status_code}")
-        print(f"Response:\n{json.dumps(response.json(), indent=2)}")
+    response = await client.get("/health")
+    print(f"Status: {response.status_code}")
+    print(f"Response:\n{_pretty(_loads(response.content))}")
 
 
-async def test_get_factors():
+@pytest.mark.anyio
+async def test_get_factors(client: httpx.AsyncClient):
     """Test the /factors endpoint."""
     print("\n" + "="*70)
     print("TEST 2: Get Resolution Factors")
     print("="*70)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/factors")
-        data = response.json()
-        print(f"Status: {response.status_code}")
-        print(f"Total Factors: {data['total_factors']}")
-        print(f"Total Weight: {data['total_weight']}")
-        print(f"\nFirst 3 Factors:")
-        for i, (name, info) in enumerate(list(data['factors'].items())[:3]):
-            print(f"  {i+1}. {name}: weight={info['weight']}")
+    # Only the first 3 factors are printed, so only ask for those
+    response = await client.get("/factors", params={"limit": 3, "summary": "true"})
+    data = _loads(response.content)
+    print(f"Status: {response.status_code}")
+    print(f"Total Factors: {data['total_factors']}")
+    print(f"Total Weight: {data['total_weight']}")
+    print(f"\nFirst 3 Factors:")
+    for i, (name, info) in enumerate(list(data['factors'].items())[:3]):
+        print(f"  {i+1}. {name}: weight={info['weight']}")
 
 
-async def test_resolve_intent_scenario_1():
+@pytest.mark.anyio
+async def test_resolve_intent_scenario_1(client: httpx.AsyncClient):
     """
     Scenario 1: "Take me to the bank" in financial context
     Expected: navigate_to_financial_institution
@@ -67,39 +353,28 @@ async def test_resolve_intent_scenario_1():
     print("Context: Manhattan, business hours, analyst user")
     print("-"*70)
     
-    request_data = {
-        "command_text": "take me to the bank",
-        "context": {
-            "location_context": "manhattan",
-            "temporal_context": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-            "user_profile": "analyst",
-            "association_history": ["viewed_portfolio", "paid_bill"],
-            "goal_alignment": "finance"
-        }
-    }
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    payload = SCENARIO_1_PAYLOAD.replace(b"__TS__", timestamp.encode())
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/resolve-intent",
-            json=request_data
-        )
-        
-        data = response.json()
-        print(f"Status: {response.status_code}")
-        print(f"\nResolved Intent: {data['resolved_intent']}")
-        print(f"Confidence: {data['confidence_score']:.1%}")
-        print(f"Processing Time: {data['processing_time_ms']:.2f}ms")
-        print(f"\nTop Contributing Factors:")
-        for i, factor in enumerate(data['contributing_factors'][:3]):
-            print(f"  {i+1}. {factor['factor_name']}: delta={factor['delta']:+.2f} ({factor['influence']})")
-        
-        if data.get('alternative_intents'):
-            print(f"\nAlternative Intents:")
-            for intent, score in list(data['alternative_intents'].items())[:2]:
-                print(f"  - {intent}: {score:.1%}")
+    response = await _post_resolve(client, payload)
+    
+    data = _loads(response.content)
+    print(f"Status: {response.status_code}")
+    print(f"\nResolved Intent: {data['resolved_intent']}")
+    print(f"Confidence: {data['confidence_score']:.1%}")
+    print(f"Processing Time: {data['processing_time_ms']:.2f}ms")
+    print(f"\nTop Contributing Factors:")
+    for i, factor in enumerate(data['contributing_factors'][:3]):
+        print(f"  {i+1}. {factor['factor_name']}: delta={factor['delta']:+.2f} ({factor['influence']})")
+    
+    if data.get('alternative_intents'):
+        print(f"\nAlternative Intents:")
+        for intent, score in list(data['alternative_intents'].items())[:2]:
+            print(f"  - {intent}: {score:.1%}")
 
 
-async def test_resolve_intent_scenario_2():
+@pytest.mark.anyio
+async def test_resolve_intent_scenario_2(client: httpx.AsyncClient):
     """
     Scenario 2: "Take me to the bank" in outdoor context
     Expected: navigate_to_river_bank
@@ -111,34 +386,22 @@ async def test_resolve_intent_scenario_2():
     print("Context: Nature, outdoor, fishing activity")
     print("-"*70)
     
-    request_data = {
-        "command_text": "take me to the bank",
-        "context": {
-            "location_context": "nature_reserve",
-            "situation_context": "outdoor_hiking",
-            "association_history": ["fishing", "outdoor_gear", "trail_maps"],
-            "goal_alignment": "recreation",
-            "input_fidelity": 0.95
-        }
-    }
+    payload = SCENARIO_2_PAYLOAD
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/resolve-intent",
-            json=request_data
-        )
-        
-        data = response.json()
-        print(f"Status: {response.status_code}")
-        print(f"\nResolved Intent: {data['resolved_intent']}")
-        print(f"Confidence: {data['confidence_score']:.1%}")
-        print(f"Processing Time: {data['processing_time_ms']:.2f}ms")
-        print(f"\nTop Contributing Factors:")
-        for i, factor in enumerate(data['contributing_factors'][:3]):
-            print(f"  {i+1}. {factor['factor_name']}: delta={factor['delta']:+.2f} ({factor['influence']})")
+    response = await _post_resolve(client, payload)
+    
+    data = _loads(response.content)
+    print(f"Status: {response.status_code}")
+    print(f"\nResolved Intent: {data['resolved_intent']}")
+    print(f"Confidence: {data['confidence_score']:.1%}")
+    print(f"Processing Time: {data['processing_time_ms']:.2f}ms")
+    print(f"\nTop Contributing Factors:")
+    for i, factor in enumerate(data['contributing_factors'][:3]):
+        print(f"  {i+1}. {factor['factor_name']}: delta={factor['delta']:+.2f} ({factor['influence']})")
 
 
-async def test_resolve_intent_minimal():
+@pytest.mark.anyio
+async def test_resolve_intent_minimal(client: httpx.AsyncClient):
     """
     Scenario 3: Minimal context (just command text)
     Expected: Baseline resolution without contextual boosts
@@ -150,29 +413,23 @@ async def test_resolve_intent_minimal():
     print("Context: Empty (baseline)")
     print("-"*70)
     
-    request_data = {
-        "command_text": "set a 5 minute timer",
-        "context": {}
-    }
+    payload = MINIMAL_PAYLOAD
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/resolve-intent",
-            json=request_data
-        )
-        
-        data = response.json()
-        print(f"Status: {response.status_code}")
-        print(f"\nResolved Intent: {data['resolved_intent']}")
-        print(f"Confidence: {data['confidence_score']:.1%}")
-        print(f"Processing Time: {data['processing_time_ms']:.2f}ms")
-        print(f"Active Factors: {len(data['audit_trail']['active_factors'])}")
-        print(f"\nAll Scores:")
-        for intent, score in data['audit_trail']['all_scores'].items():
-            print(f"  {intent}: {score:.1%}")
-
-
-async def test_error_handling():
+    response = await _post_resolve(client, payload)
+    
+    data = _loads(response.content)
+    print(f"Status: {response.status_code}")
+    print(f"\nResolved Intent: {data['resolved_intent']}")
+    print(f"Confidence: {data['confidence_score']:.1%}")
+    print(f"Processing Time: {data['processing_time_ms']:.2f}ms")
+    print(f"Active Factors: {len(data['audit_trail']['active_factors'])}")
+    print(f"\nAll Scores:")
+    for intent, score in data['audit_trail']['all_scores'].items():
+        print(f"  {intent}: {score:.1%}")
+
+
+@pytest.mark.anyio
+async def test_error_handling(client: httpx.AsyncClient):
     """
     Test error handling with invalid input
     """
@@ -182,53 +439,110 @@ async def test_error_handling():
     print("Input: Invalid semantic_capacity value (should be 0-1)")
     print("-"*70)
     
-    request_data = {
-        "command_text": "turn on the lights",
-        "context": {
-            "semantic_capacity": 1.5,  # Invalid: > 1.0
-        }
-    }
+    payload = ERROR_PAYLOAD
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/resolve-intent",
-            json=request_data
-        )
+    response = await client.post("/resolve-intent", content=payload, headers=JSON_HEADERS)
+    
+    print(f"Status: {response.status_code}")
+    if response.status_code != 200:
+        print(f"Error Response:\n{_pretty(_loads(response.content))}")
+    else:
+        print("✓ Request succeeded (validation passed)")
+
+
+def test_client_reuses_connections():
+    """
+    Guard the pooled client: 100 sequential requests must share keep-alive
+    connections rather than opening one each.
+    
+    Runs against a tiny local HTTP/1.1 server that counts accepted TCP
+    connections, so no Sphota server is needed.
+    """
+    body = b'{"status": "healthy"}'
+    reply = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+    
+    async def run() -> int:
+        connections = 0
         
-        print(f"Status: {response.status_code}")
-        if response.status_code != 200:
-            print(f"Error Response:\n{json.dumps(response.json(), indent=2)}")
-        else:
-            print("✓ Request succeeded (validation passed)")
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal connections
+            connections += 1
+            try:
+                while await reader.readuntil(b"\r\n\r\n"):  # GETs carry no body
+                    writer.write(reply)
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+        
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            async with make_client(f"http://127.0.0.1:{port}") as client:
+                for _ in range(100):
+                    response = await client.get("/health")
+                    assert response.status_code == 200
+        return connections
+    
+    connections = asyncio.run(run())
+    assert connections <= 2, f"100 requests opened {connections} connections"
 
 
-async def main():
-    """Run all tests."""
+async def main(mock: bool = False):
+    """Run all tests, against canned responses instead of a server if mock is set."""
+    global _batcher
+    
     print("\n" + "█"*70)
     print("SPHOTA FASTAPI MICROSERVICE - TEST SUITE")
     print("█"*70)
-    print(f"Base URL: {BASE_URL}")
-    print("Make sure the server is running: uvicorn main:app --port 8000")
-    
-    try:
-        # Test endpoint availability
-        async with httpx.AsyncClient() as client:
-            await client.get(f"{BASE_URL}/health", timeout=2.0)
-    except Exception as e:
-        print(f"\n✗ ERROR: Cannot connect to {BASE_URL}")
-        print(f"  Make sure the server is running!")
-        print(f"  Start it with: uvicorn main:app --port 8000")
-        return
+    if mock:
+        print(f"Base URL: {BASE_URL} (mocked, no server needed)")
+    else:
+        print(f"Base URL: {BASE_URL}")
+        print("Make sure the server is running: uvicorn main:app --port 8000")
     
-    print("\n✓ Server is running!\n")
+    client = make_client(mock=mock)
     
-    # Run tests
-    await test_health_check()
-    await test_get_factors()
-    await test_resolve_intent_scenario_1()
-    await test_resolve_intent_scenario_2()
-    await test_resolve_intent_minimal()
-    await test_error_handling()
+    async with client:
+        # The resolve scenarios run concurrently, so their POSTs coalesce
+        # into one /resolve-intent/batch call
+        _batcher = _IntentBatcher(client)
+        
+        # Run tests concurrently; each one's output is buffered and printed
+        # in order afterwards so the reports don't interleave
+        tests = (
+            test_get_factors,
+            test_resolve_intent_scenario_1,
+            test_resolve_intent_scenario_2,
+            test_resolve_intent_minimal,
+            test_error_handling,
+        )
+        stdout = sys.stdout
+        sys.stdout = _TaskStdout(stdout)
+        try:
+            # The health check doubles as the connectivity probe, so it runs
+            # (in its own task, for its own buffer) before the rest start
+            results = [await asyncio.create_task(_run_captured(test_health_check, client))]
+            server_up = not isinstance(results[0][1], (httpx.ConnectError, httpx.ConnectTimeout))
+            if server_up:
+                results += await asyncio.gather(*(_run_captured(test, client) for test in tests))
+        finally:
+            sys.stdout = stdout
+        
+        if not server_up:
+            print(f"\n✗ ERROR: Cannot connect to {BASE_URL}")
+            print(f"  Make sure the server is running!")
+            print(f"  Start it with: uvicorn main:app --port 8000")
+            return
+        
+        print("\n✓ Server is running!\n")
+        
+        for output, _ in results:
+            print(output, end="")
+        for _, error in results:
+            if error is not None:
+                raise error
     
     # Summary
     print("\n" + "█"*70)
@@ -243,4 +557,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Exercise the Sphota FastAPI endpoints")
+    parser.add_argument("--mock", action="store_true", help="serve canned responses in-process instead of calling a server")
+    args = parser.parse_args()
+    
+    if uvloop is not None:
+        uvloop.run(main(mock=args.mock))
+    else:
+        asyncio.run(main(mock=args.mock))
@@ -6,321 +6,317 @@ Tests:
 1. ContextManager functionality (all 12 factors)
 2. Intent database structure
 3. App integration
+4. Polysemic disambiguation (end-to-end)
+
+Every test is independent, so the module runs in parallel under
+`pytest tests/test_comprehensive.py -n auto`; running the file directly
+does the same when pytest-xdist is installed.
 """
 
+import importlib.util
+import mmap
+import re
 import sys
-import json
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List
 
-def test_context_manager():
-    """Test ContextManager with 12 factors."""
-    print("\n" + "="*80)
-    print("TEST 1: CONTEXT MANAGER - 12-FACTOR MATRIX")
-    print("="*80)
-    
-    try:
-        from core.context_manager import ContextManager
-        mgr = ContextManager()
-        print("✓ ContextManager imported and initialized")
-        
-        # Test each factor
-        test_cases = [
-            ("Factor 1: Sahacarya", {
-                'intent': {'type': 'booking', 'keywords': ['flight', 'book'], 'register': 'Neutral'},
-                'context': {'command_history': ['search for flights', 'check travel dates'], 'system_state': 'OFF', 'user_input': 'book it', 'current_task_id': None, 'current_screen': None, 'social_mode': 'Casual', 'gps_tag': None, 'current_hour': 12, 'user_demographic': 'Millennial', 'audio_pitch': 'Neutral', 'input_confidence': 0.9},
-                'base_score': 0.5,
-                'check': lambda s, b: (s - b) >= 0.19  # +0.2 boost
-            }),
-            ("Factor 2: Virodhitā", {
-                'intent': {'type': 'turn_on', 'keywords': ['turn', 'on'], 'register': 'Neutral'},
-                'context': {'command_history': [], 'system_state': 'ON', 'user_input': 'turn on', 'current_task_id': None, 'current_screen': None, 'social_mode': 'Casual', 'gps_tag': None, 'current_hour': 12, 'user_demographic': 'Millennial', 'audio_pitch': 'Neutral', 'input_confidence': 0.9},
-                'base_score': 0.8,
-                'check': lambda s, b: s < b * 0.2  # 0.1x penalty
-            }),
-            ("Factor 7: Aucitī", {
-                'intent': {'type': 'evaluation', 'keywords': ['sick'], 'register': 'Slang'},
-                'context': {'command_history': [], 'system_state': 'OFF', 'user_input': 'sick', 'current_task_id': None, 'current_screen': None, 'social_mode': 'Business', 'gps_tag': None, 'current_hour': 12, 'user_demographic': 'Professional', 'audio_pitch': 'Neutral', 'input_confidence': 0.9},
-                'base_score': 0.7,
-                'check': lambda s, b: s < b * 0.6  # 0.5x penalty
-            }),
-            ("Factor 8: Deśa", {
-                'intent': {'type': 'reference', 'keywords': ['bank'], 'required_location': 'downtown', 'register': 'Neutral'},
-                'context': {'command_history': [], 'system_state': 'OFF', 'user_input': 'bank', 'current_task_id': None, 'current_screen': None, 'social_mode': 'Business', 'gps_tag': 'Downtown', 'current_hour': 12, 'user_demographic': 'Professional', 'audio_pitch': 'Neutral', 'input_confidence': 0.9},
-                'base_score': 0.5,
-                'check': lambda s, b: (s - b) >= 0.19  # +0.2 boost
-            }),
-            ("Factor 11: Svara", {
-                'intent': {'type': 'alarm', 'keywords': ['urgent'], 'urgency': 'Urgent', 'register': 'Neutral'},
-                'context': {'command_history': [], 'system_state': 'OFF', 'user_input': 'urgent', 'current_task_id': None, 'current_screen': None, 'social_mode': 'Casual', 'gps_tag': None, 'current_hour': 12, 'user_demographic': 'Millennial', 'audio_pitch': 'High', 'input_confidence': 0.9},
-                'base_score': 0.5,
-                'check': lambda s, b: (s - b) >= 0.14  # +0.15 boost
-            }),
-        ]
-        
-        for test_name, test_data in test_cases:
-            score = mgr.calculate_confidence(test_data['intent'], test_data['context'], test_data['base_score'])
-            
-            if test_data['check'](score, test_data['base_score']):
-                print(f"  ✓ {test_name}: {score:.3f}")
-            else:
-                print(f"  ✗ {test_name}: {score:.3f} (check failed)")
-                return False
-        
-        # Test score bounds
-        test_score = mgr.calculate_confidence({'type': 'test', 'keywords': []}, {'system_state': 'OFF', 'user_input': 'test', 'current_task_id': None, 'current_screen': None, 'social_mode': 'Casual', 'gps_tag': None, 'current_hour': 12, 'user_demographic': 'Millennial', 'audio_pitch': 'Neutral', 'input_confidence': 0.9, 'command_history': []}, 0.5)
-        
-        if 0.0 <= test_score <= 1.0:
-            print(f"  ✓ Score bounds [0, 1]: {test_score:.3f}")
-        else:
-            print(f"  ✗ Score out of bounds: {test_score:.3f}")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ ContextManager test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_intent_db():
+import numpy as np
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+# Add parent directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Imported once up front; if it fails only the scoring tests skip, the
+# database and app checks still run
+try:
+    from core.context_manager import ContextManager
+    _CTX_IMPORT_ERROR = None
+except ImportError as e:
+    ContextManager = None
+    _CTX_IMPORT_ERROR = e
+
+requires_context_manager = pytest.mark.skipif(
+    ContextManager is None,
+    reason=f"core.context_manager unavailable: {_CTX_IMPORT_ERROR}"
+)
+
+
+# Neutral context every test starts from; read-only so no test can alter it
+_DEFAULT_CTX = MappingProxyType({
+    'command_history': (),
+    'system_state': 'OFF',
+    'user_input': '',
+    'current_task_id': None,
+    'current_screen': None,
+    'social_mode': 'Casual',
+    'gps_tag': None,
+    'current_hour': 12,
+    'user_demographic': 'Millennial',
+    'audio_pitch': 'Neutral',
+    'input_confidence': 0.9,
+})
+
+
+# ============================================================================
+# TEST 1: CONTEXT MANAGER - 12-FACTOR MATRIX
+# ============================================================================
+
+# check name -> predicate(score, base, threshold); works on floats and on NumPy arrays
+_CHECKS = {
+    'boost': lambda s, b, t: (s - b) >= t,    # score rose by at least t
+    'penalty': lambda s, b, t: s < b * t,     # score fell below t x base
+}
+
+# (intent, context, base_score, (check, threshold)) per factor
+FACTOR_CASES = [
+    pytest.param(
+        {'type': 'booking', 'keywords': ['flight', 'book'], 'register': 'Neutral'},
+        {**_DEFAULT_CTX, 'command_history': ('search for flights', 'check travel dates'), 'user_input': 'book it'},
+        0.5,
+        ('boost', 0.19),  # +0.2 boost
+        id="factor-1-sahacarya"
+    ),
+    pytest.param(
+        {'type': 'turn_on', 'keywords': ['turn', 'on'], 'register': 'Neutral'},
+        {**_DEFAULT_CTX, 'system_state': 'ON', 'user_input': 'turn on'},
+        0.8,
+        ('penalty', 0.2),  # 0.1x penalty
+        id="factor-2-virodhita"
+    ),
+    pytest.param(
+        {'type': 'evaluation', 'keywords': ['sick'], 'register': 'Slang'},
+        {**_DEFAULT_CTX, 'user_input': 'sick', 'social_mode': 'Business', 'user_demographic': 'Professional'},
+        0.7,
+        ('penalty', 0.6),  # 0.5x penalty
+        id="factor-7-auciti"
+    ),
+    pytest.param(
+        {'type': 'reference', 'keywords': ['bank'], 'required_location': 'downtown', 'register': 'Neutral'},
+        {**_DEFAULT_CTX, 'user_input': 'bank', 'social_mode': 'Business', 'gps_tag': 'Downtown', 'user_demographic': 'Professional'},
+        0.5,
+        ('boost', 0.19),  # +0.2 boost
+        id="factor-8-desa"
+    ),
+    pytest.param(
+        {'type': 'alarm', 'keywords': ['urgent'], 'urgency': 'Urgent', 'register': 'Neutral'},
+        {**_DEFAULT_CTX, 'user_input': 'urgent', 'audio_pitch': 'High'},
+        0.5,
+        ('boost', 0.14),  # +0.15 boost
+        id="factor-11-svara"
+    ),
+]
+
+
+@requires_context_manager
+@pytest.mark.parametrize("intent,context,base_score,check", FACTOR_CASES)
+def test_context_manager_factor(context_mgr, intent, context, base_score, check):
+    """Each factor moves the score in the expected direction."""
+    score = context_mgr.calculate_confidence(intent, context, base_score)
+    op, threshold = check
+    assert _CHECKS[op](score, base_score, threshold), (
+        f"{op} check failed: {score:.3f} from base {base_score}"
+    )
+
+
+@requires_context_manager
+def test_context_manager_factor_batch(context_mgr):
+    """Batch scoring matches per-call scoring and passes every factor check."""
+    intents, contexts, base_scores, checks = zip(*(case.values for case in FACTOR_CASES))
+    scores = context_mgr.calculate_confidence_batch(intents, contexts, base_scores)
+
+    expected = [context_mgr.calculate_confidence(*args) for args in zip(intents, contexts, base_scores)]
+    assert scores.tolist() == expected
+
+    # One vector comparison per check kind over the cases that use it
+    base = np.array(base_scores)
+    ops = np.array([op for op, _ in checks])
+    thresholds = np.array([threshold for _, threshold in checks])
+    for op, predicate in _CHECKS.items():
+        mask = ops == op
+        assert predicate(scores[mask], base[mask], thresholds[mask]).all(), f"{op} check failed"
+
+
+@requires_context_manager
+def test_confidence_kernel_matches_numpy():
+    """The row-loop kernel numba compiles agrees exactly with the NumPy fallback."""
+    from core.context_manager_jit import MULTIPLICATIVE_MASK, _confidence_kernel, _confidence_numpy
+
+    rng = np.random.default_rng(0)
+    base = rng.random(64)
+    adjustments = np.where(MULTIPLICATIVE_MASK, rng.uniform(0.1, 1.2, (64, 12)), rng.uniform(-0.2, 0.2, (64, 12)))
+
+    expected = _confidence_numpy(base, adjustments, MULTIPLICATIVE_MASK)
+    assert _confidence_kernel(base, adjustments, MULTIPLICATIVE_MASK).tolist() == expected.tolist()
+
+
+@requires_context_manager
+def test_context_manager_score_bounds(context_mgr):
+    """Scores stay within [0, 1]."""
+    score = context_mgr.calculate_confidence(
+        {'type': 'test', 'keywords': []},
+        {**_DEFAULT_CTX, 'user_input': 'test'},
+        0.5
+    )
+    assert 0.0 <= score <= 1.0, f"Score out of bounds: {score:.3f}"
+
+
+# ============================================================================
+# TEST 2: INTENT DATABASE - POLYSEMIC TEST CASES
+# ============================================================================
+
+# Polysemic test case intent_id -> factor it exercises
+REQUIRED_TEST_CASES = {
+    "turn_on_lights_conflict_test": "Virodhitā (Conflict)",
+    "thats_sick_propriety_test": "Aucitī (Propriety)",
+    "right_intonation_test": "Svara (Intonation)",
+    "book_it_association_test": "Sahacarya (Association)",
+    "bank_location_test": "Deśa (Location)"
+}
+
+
+class _IntentRecord(BaseModel):
+    """Fields of an intent_db.json entry the tests rely on."""
+    intent_id: str
+    test_scenarios: List[Dict[str, Any]] = []
+
+
+class _IntentDB(BaseModel):
+    """Top-level intent_db.json layout."""
+    intents: List[_IntentRecord] = Field(min_length=5)
+
+
+def test_intent_db(intent_db):
     """Test intent_db.json structure."""
-    print("\n" + "="*80)
-    print("TEST 2: INTENT DATABASE - POLYSEMIC TEST CASES")
-    print("="*80)
-    
-    try:
-        intent_db_path = Path("data/intent_db.json")
-        
-        if not intent_db_path.exists():
-            print(f"✗ Intent database not found: {intent_db_path}")
-            return False
-        
-        with open(intent_db_path, 'r', encoding='utf-8') as f:
-            intent_db = json.load(f)
-        
-        print(f"✓ Intent database loaded")
-        
-        # Check structure
-        assert 'intents' in intent_db, "Missing 'intents' key"
-        assert isinstance(intent_db['intents'], list), "Intents must be a list"
-        assert len(intent_db['intents']) >= 5, f"Expected at least 5 intents, got {len(intent_db['intents'])}"
-        
-        print(f"✓ Database structure valid: {len(intent_db['intents'])} intents")
-        
-        # Check each intent
-        required_test_cases = {
-            "turn_on_lights_conflict_test": "Virodhitā (Conflict)",
-            "thats_sick_propriety_test": "Aucitī (Propriety)",
-            "right_intonation_test": "Svara (Intonation)",
-            "book_it_association_test": "Sahacarya (Association)",
-            "bank_location_test": "Deśa (Location)"
-        }
-        
-        found_tests = {}
-        for intent in intent_db['intents']:
-            intent_id = intent.get('intent_id', '')
-            if intent_id in required_test_cases:
-                found_tests[intent_id] = intent
-                
-                # Verify test scenarios exist
-                scenarios = intent.get('test_scenarios', [])
-                assert len(scenarios) > 0, f"Intent {intent_id} has no test scenarios"
-                
-                print(f"  ✓ {required_test_cases[intent_id]}: {len(scenarios)} scenarios")
-        
-        if len(found_tests) != len(required_test_cases):
-            print(f"✗ Missing test cases. Found {len(found_tests)}/{len(required_test_cases)}")
-            return False
-        
-        print(f"✓ All 5 polysemic test cases present")
-        return True
-        
-    except Exception as e:
-        print(f"✗ Intent database test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_app_integration():
-    """Test app.py integration with ContextManager."""
-    print("\n" + "="*80)
-    print("TEST 3: STREAMLIT APP INTEGRATION")
-    print("="*80)
-    
+    # One validation pass replaces the hand-written key/type/length asserts
     try:
-        # Check imports
-        from core.context_manager import ContextManager
-        print("✓ ContextManager importable from app location")
-        
-        # Check app.py has required elements
-        app_path = Path("app.py")
-        if not app_path.exists():
-            print("✗ app.py not found")
-            return False
-        
-        app_content = app_path.read_text(encoding='utf-8')
-        
-        required_elements = [
-            ("from core.context_manager import ContextManager", "ContextManager import"),
-            ("load_context_manager", "Context manager loader"),
-            ("social_mode", "Social mode control"),
-            ("system_state", "System state control"),
-            ("history_type", "History type control"),
-            ("audio_pitch", "Audio pitch control"),
-            ("st.expander", "Expander widget"),
-            ("plotly", "Chart visualization"),
-        ]
-        
-        for element, description in required_elements:
-            if element in app_content:
-                print(f"  ✓ {description} found in app.py")
-            else:
-                print(f"  ✗ {description} NOT found in app.py")
-                return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ App integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_polysemic_disambiguation():
-    """Test polysemic disambiguation scenarios."""
-    print("\n" + "="*80)
-    print("TEST 4: POLYSEMIC DISAMBIGUATION - END-TO-END")
-    print("="*80)
-    
+        _IntentDB.model_validate(intent_db)
+    except ValidationError as e:
+        pytest.fail(f"intent_db.json does not match the expected schema:\n{e}")
+
+
+@pytest.mark.parametrize("intent_id", REQUIRED_TEST_CASES)
+def test_intent_db_polysemic_case(intent_by_id, intent_id):
+    """Each polysemic test case is present and has test scenarios."""
+    intent = intent_by_id.get(intent_id)
+    assert intent is not None, f"Missing test case for {REQUIRED_TEST_CASES[intent_id]}: {intent_id}"
+    assert len(intent.get('test_scenarios', [])) > 0, f"Intent {intent_id} has no test scenarios"
+
+
+# ============================================================================
+# TEST 3: STREAMLIT APP INTEGRATION
+# ============================================================================
+
+# (needle, description) for each piece of ContextManager wiring app.py must contain
+APP_ELEMENTS = (
+    ("from core.context_manager import ContextManager", "ContextManager import"),
+    ("load_context_manager", "Context manager loader"),
+    ("social_mode", "Social mode control"),
+    ("system_state", "System state control"),
+    ("history_type", "History type control"),
+    ("audio_pitch", "Audio pitch control"),
+    ("st.expander", "Expander widget"),
+    ("plotly", "Chart visualization"),
+)
+
+# One alternation over every needle, so app.py is scanned in a single pass.
+# The needles are ASCII, so the pattern runs on the raw bytes with no decode.
+_APP_PATTERN = re.compile(b'|'.join(re.escape(needle.encode('ascii')) for needle, _ in APP_ELEMENTS))
+
+
+@pytest.fixture(scope="module")
+def app_elements():
+    """Needles found in app.py, scanned once; skips the app checks when there is no app.py."""
     try:
-        from core.context_manager import ContextManager
-        
-        mgr = ContextManager()
-        
-        # Test 1: 'bank' disambiguation
-        river_intent = {
-            'type': 'reference',
-            'keywords': ['bank', 'river'],
-            'required_location': 'riverside park',
-            'register': 'Neutral'
-        }
-        
-        financial_intent = {
-            'type': 'reference',
-            'keywords': ['bank', 'finance'],
-            'required_location': 'downtown',
-            'register': 'Neutral'
-        }
-        
-        nature_context = {
-            'command_history': ['Show hiking trails'],
-            'system_state': 'OFF',
-            'user_input': 'bank',
-            'current_task_id': None,
-            'current_screen': None,
-            'social_mode': 'Casual',
-            'gps_tag': 'Riverside Park',
-            'current_hour': 10,
-            'user_demographic': 'Gen X',
-            'audio_pitch': 'Neutral',
-            'input_confidence': 0.9
-        }
-        
-        river_score = mgr.calculate_confidence(river_intent, nature_context, 0.5)
-        financial_score = mgr.calculate_confidence(financial_intent, nature_context, 0.5)
-        
-        if river_score > financial_score:
-            print(f"  ✓ 'bank' → River (nature): {river_score:.3f} > {financial_score:.3f}")
-        else:
-            print(f"  ✗ 'bank' disambiguation failed in nature context")
-            return False
-        
-        # Test 2: 'sick' disambiguation
-        positive_intent = {
-            'type': 'evaluation',
-            'keywords': ['cool'],
-            'register': 'Slang'
-        }
-        
-        casual_context = {
-            'command_history': [],
-            'system_state': 'OFF',
-            'user_input': 'That\'s sick',
-            'current_task_id': None,
-            'current_screen': None,
-            'social_mode': 'Casual',
-            'gps_tag': None,
-            'current_hour': 12,
-            'user_demographic': 'Gen Z',
-            'audio_pitch': 'High',
-            'input_confidence': 0.92
-        }
-        
-        business_context = dict(casual_context)
-        business_context['social_mode'] = 'Business'
-        business_context['user_demographic'] = 'Professional'
-        
-        casual_score = mgr.calculate_confidence(positive_intent, casual_context, 0.6)
-        business_score = mgr.calculate_confidence(positive_intent, business_context, 0.6)
-        
-        if casual_score > business_score:
-            print(f"  ✓ 'sick' → Positive (casual): {casual_score:.3f} > business: {business_score:.3f}")
-        else:
-            print(f"  ✗ 'sick' disambiguation failed")
-            return False
-        
-        print(f"✓ Polysemic disambiguation working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"✗ Polysemic test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("\n" + "="*80)
-    print("SPHOTA.AI - COMPREHENSIVE TEST SUITE")
-    print("12-Factor Context Resolution Matrix + App Integration")
-    print("="*80)
-    
-    results = []
-    
-    # Run tests
-    results.append(("ContextManager Tests", test_context_manager()))
-    results.append(("Intent Database Tests", test_intent_db()))
-    results.append(("App Integration Tests", test_app_integration()))
-    results.append(("Polysemic Disambiguation", test_polysemic_disambiguation()))
-    
-    # Summary
-    print("\n" + "="*80)
-    print("TEST SUMMARY")
-    print("="*80)
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status}: {test_name}")
-    
-    print(f"\nTotal: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("\n" + "="*80)
-        print("✓ ALL TESTS PASSED - SYSTEM READY FOR DEPLOYMENT")
-        print("="*80 + "\n")
-        return 0
-    else:
-        print("\n✗ Some tests failed. Please review above.")
-        return 1
+        f = open(project_root / "app.py", 'rb')
+    except FileNotFoundError:
+        pytest.skip("app.py not found (Streamlit app not in this checkout)")
+    with f:
+        try:
+            app_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return set()  # mmap can't map an empty file
+        try:
+            return {needle.decode('ascii') for needle in _APP_PATTERN.findall(app_content)}
+        finally:
+            app_content.close()
+
+
+@pytest.mark.parametrize("element,description", APP_ELEMENTS)
+def test_app_integration(app_elements, element, description):
+    """Test app.py integration with ContextManager."""
+    assert element in app_elements, f"{description} NOT found in app.py"
+
+
+# ============================================================================
+# TEST 4: POLYSEMIC DISAMBIGUATION - END-TO-END
+# ============================================================================
+
+@requires_context_manager
+def test_polysemic_bank_disambiguation(context_mgr):
+    """'bank' resolves to the river in a nature context."""
+    river_intent = {
+        'type': 'reference',
+        'keywords': ['bank', 'river'],
+        'required_location': 'riverside park',
+        'register': 'Neutral'
+    }
+
+    financial_intent = {
+        'type': 'reference',
+        'keywords': ['bank', 'finance'],
+        'required_location': 'downtown',
+        'register': 'Neutral'
+    }
+
+    nature_context = {
+        **_DEFAULT_CTX,
+        'command_history': ('Show hiking trails',),
+        'user_input': 'bank',
+        'gps_tag': 'Riverside Park',
+        'current_hour': 10,
+        'user_demographic': 'Gen X',
+    }
+
+    river_score = context_mgr.calculate_confidence(river_intent, nature_context, 0.5)
+    financial_score = context_mgr.calculate_confidence(financial_intent, nature_context, 0.5)
+
+    assert river_score > financial_score, (
+        f"'bank' disambiguation failed in nature context: {river_score:.3f} <= {financial_score:.3f}"
+    )
+
+
+@requires_context_manager
+def test_polysemic_sick_disambiguation(context_mgr):
+    """Slang 'sick' scores higher in a casual context than in a business one."""
+    positive_intent = {
+        'type': 'evaluation',
+        'keywords': ['cool'],
+        'register': 'Slang'
+    }
+
+    casual_context = {
+        **_DEFAULT_CTX,
+        'user_input': 'That\'s sick',
+        'user_demographic': 'Gen Z',
+        'audio_pitch': 'High',
+        'input_confidence': 0.92,
+    }
+
+    business_context = casual_context | {'social_mode': 'Business', 'user_demographic': 'Professional'}
+
+    casual_score = context_mgr.calculate_confidence(positive_intent, casual_context, 0.6)
+    business_score = context_mgr.calculate_confidence(positive_intent, business_context, 0.6)
+
+    assert casual_score > business_score, (
+        f"'sick' disambiguation failed: casual {casual_score:.3f} <= business {business_score:.3f}"
+    )
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    args = [__file__, "-v"]
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto"]  # Spread the independent tests across workers
+    sys.exit(pytest.main(args))
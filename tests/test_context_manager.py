@@ -16,8 +16,10 @@ Test suite covering all 12 factors of the Context Resolution Matrix:
 12. Apabhraṃśa (Fidelity)
 """
 
+import numpy as np
 import pytest
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any
 from core.context_manager import ContextManager
 
@@ -25,14 +27,8 @@ from core.context_manager import ContextManager
 class TestContextManagerBasics:
     """Test basic ContextManager initialization and utility methods."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        """Create a ContextManager instance."""
-        return ContextManager()
-    
     def test_initialization(self, context_mgr: ContextManager):
         """Test ContextManager initializes with empty history."""
-        assert isinstance(context_mgr.command_history, list)
         assert len(context_mgr.command_history) == 0
         assert context_mgr.max_history_length == 10
     
@@ -56,6 +52,25 @@ class TestContextManagerBasics:
         assert history[0] == "command_5"  # Oldest retained
         assert history[-1] == "command_14"  # Newest
     
+    def test_max_history_length_resizes_history(self):
+        """Test changing max_history_length rebounds the existing history."""
+        manager = ContextManager()
+        manager.extend_command_history(f"command_{i}" for i in range(10))
+        
+        manager.max_history_length = 3
+        assert manager.get_command_history() == ["command_7", "command_8", "command_9"]
+        
+        manager.max_history_length = 5
+        manager.extend_command_history(["command_10", "command_11", "command_12"])
+        assert manager.get_command_history() == [f"command_{i}" for i in range(8, 13)]
+    
+    def test_extend_command_history(self, context_mgr: ContextManager):
+        """Test batch history updates keep only the newest max length commands."""
+        context_mgr.extend_command_history(f"command_{i}" for i in range(15))
+        
+        history = context_mgr.get_command_history()
+        assert history == [f"command_{i}" for i in range(5, 15)]
+    
     def test_clear_command_history(self, context_mgr: ContextManager):
         """Test command history can be cleared."""
         context_mgr.update_command_history("test")
@@ -64,42 +79,133 @@ class TestContextManagerBasics:
         assert len(context_mgr.get_command_history()) == 0
 
 
+# Neutral context every test starts from; read-only, so tests overlay it via _ctx
+_DEFAULT_CTX = MappingProxyType({
+    "command_history": (),
+    "system_state": "OFF",
+    "user_input": "",
+    "current_task_id": None,
+    "current_screen": None,
+    "social_mode": "Casual",
+    "gps_tag": None,
+    "current_hour": 12,
+    "user_demographic": "Millennial",
+    "audio_pitch": "Neutral",
+    "input_confidence": 0.9
+})
+
+
+def _ctx(**overrides: Any) -> Dict[str, Any]:
+    """Return a fresh context dict: _DEFAULT_CTX with the given keys replaced."""
+    context_data = dict(_DEFAULT_CTX)
+    context_data.update(overrides)
+    return context_data
+
+
+# (intent, context overrides, base_score, expected boost) per boosting factor
+BOOST_CASES = [
+    pytest.param(
+        {"type": "booking", "keywords": ["flight", "book", "travel"], "register": "Casual"},
+        {"command_history": ["search for flights", "check travel dates", "compare airlines"], "user_input": "book it"},
+        0.5, 0.2,
+        id="factor-1-association-keyword-match"
+    ),
+    pytest.param(
+        {"type": "action", "keywords": ["execute"], "task_id": "lighting_control", "register": "Neutral"},
+        {"user_input": "control lights", "current_task_id": "lighting_control"},
+        0.5, 0.15,
+        id="factor-3-matching-task-id"
+    ),
+    pytest.param(
+        {"type": "control", "keywords": ["lights"], "valid_screens": ["Home", "LivingRoom", "Kitchen"], "register": "Neutral"},
+        {"user_input": "turn on lights", "current_screen": "Home"},
+        0.5, 0.12,
+        id="factor-4-valid-screen"
+    ),
+    pytest.param(
+        {"type": "question", "keywords": ["what", "where"], "register": "Neutral"},
+        {"user_input": "What time is it?"},
+        0.5, 0.1,
+        id="factor-5-question-mark"
+    ),
+    pytest.param(
+        {"type": "command", "keywords": ["execute"], "register": "Neutral"},
+        {"user_input": "Execute now!"},
+        0.5, 0.08,
+        id="factor-5-exclamation-mark"
+    ),
+    pytest.param(
+        {"type": "reference", "keywords": ["bank"], "required_location": "riverside park", "register": "Neutral"},
+        {"user_input": "bank", "gps_tag": "Riverside Park", "user_demographic": "Gen X"},
+        0.5, 0.2,
+        id="factor-8-matching-location"
+    ),
+    pytest.param(
+        {"type": "action", "keywords": ["execute"], "valid_time_range": (9, 17), "register": "Neutral"},
+        {"user_input": "execute", "social_mode": "Business", "current_hour": 12, "user_demographic": "Professional"},
+        0.5, 0.15,
+        id="factor-9-valid-time-range"
+    ),
+    pytest.param(
+        {"type": "evaluation", "keywords": ["awesome"], "vocabulary_level": "Casual", "register": "Slang"},
+        {"user_input": "awesome", "user_demographic": "Gen Z"},
+        0.5, 0.12,
+        id="factor-10-gen-z-match"
+    ),
+    pytest.param(
+        {"type": "alarm", "keywords": ["urgent"], "urgency": "Urgent", "register": "Neutral"},
+        {"user_input": "urgent!", "audio_pitch": "High"},
+        0.5, 0.15,
+        id="factor-11-high-pitch-urgent"
+    ),
+    pytest.param(
+        {"type": "question", "keywords": ["what"], "register": "Neutral"},
+        {"user_input": "What?", "user_demographic": "Gen Z", "audio_pitch": "Rising"},
+        0.5, 0.12,
+        id="factor-11-rising-pitch-question"
+    ),
+]
+
+
+@pytest.mark.parametrize("intent,context_overrides,base_score,boost", BOOST_CASES)
+def test_factor_boost(
+    context_mgr: ContextManager,
+    intent: Dict[str, Any],
+    context_overrides: Dict[str, Any],
+    base_score: float,
+    boost: float
+):
+    """Each boosting factor raises the score by its documented amount."""
+    context_data = _ctx(**context_overrides)
+    final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
+    
+    assert final_score >= base_score + boost - 0.01  # Allow small floating point difference
+
+
+def test_factor_boosts_batch(context_mgr: ContextManager):
+    """Scoring every boost case in one batch call matches the per-call scores."""
+    intents, overrides, base_scores, boosts = zip(*(case.values for case in BOOST_CASES))
+    contexts = [_ctx(**context_overrides) for context_overrides in overrides]
+    
+    final_scores = context_mgr.calculate_confidence_batch(intents, contexts, base_scores)
+    expected = np.array([
+        context_mgr.calculate_confidence(intent, context_data, base_score)
+        for intent, context_data, base_score in zip(intents, contexts, base_scores)
+    ])
+    
+    np.testing.assert_array_equal(final_scores, expected)
+    assert np.all(final_scores >= np.array(base_scores) + np.array(boosts) - 0.01)
+
+
+def test_batch_length_mismatch(context_mgr: ContextManager):
+    """Batch scoring rejects intents, contexts and base scores of different lengths."""
+    with pytest.raises(ValueError, match="length mismatch"):
+        context_mgr.calculate_confidence_batch([{}], [_ctx(), _ctx()], [0.5])
+
+
 class TestFactorOneAssociationHistory:
     """Test Factor 1: Sahacarya (Association History)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_association_boost_with_matching_keywords(self, context_mgr: ContextManager):
-        """Test +0.2 boost for keyword match in last 3 commands."""
-        intent = {
-            "type": "booking",
-            "keywords": ["flight", "book", "travel"],
-            "register": "Casual"
-        }
-        
-        context_data = {
-            "command_history": ["search for flights", "check travel dates", "compare airlines"],
-            "system_state": "OFF",
-            "user_input": "book it",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.2 boost from association
-        expected_min = base_score + 0.2
-        assert final_score >= expected_min - 0.01  # Allow small floating point difference
-    
     def test_no_boost_without_keyword_match(self, context_mgr: ContextManager):
         """Test no boost when keywords don't match history."""
         intent = {
@@ -108,19 +214,10 @@ class TestFactorOneAssociationHistory:
             "register": "Casual"
         }
         
-        context_data = {
-            "command_history": ["search flights", "check hotels"],
-            "system_state": "OFF",
-            "user_input": "book a table",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            command_history=["search flights", "check hotels"],
+            user_input="book a table"
+        )
         
         base_score = 0.5
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -132,10 +229,6 @@ class TestFactorOneAssociationHistory:
 class TestFactorTwoConflictCheck:
     """Test Factor 2: Virodhitā (Conflict Check)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
     def test_severe_penalty_turn_on_when_already_on(self, context_mgr: ContextManager):
         """Test 0.1x multiplier (90% penalty) when system already ON."""
         intent = {
@@ -144,19 +237,10 @@ class TestFactorTwoConflictCheck:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "ON",  # Already ON - conflict!
-            "user_input": "turn on lights",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            system_state="ON",  # Already ON - conflict!
+            user_input="turn on lights"
+        )
         
         base_score = 0.8
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -173,19 +257,10 @@ class TestFactorTwoConflictCheck:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",  # OFF - no conflict
-            "user_input": "turn on lights",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            system_state="OFF",  # OFF - no conflict
+            user_input="turn on lights"
+        )
         
         base_score = 0.8
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -194,79 +269,9 @@ class TestFactorTwoConflictCheck:
         assert final_score > base_score * 0.5  # Should be relatively high
 
 
-class TestFactorThreeActiveGoal:
-    """Test Factor 3: Artha (Active Goal)."""
-    
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_matching_task_id(self, context_mgr: ContextManager):
-        """Test +0.15 boost when intent aligns with current task."""
-        intent = {
-            "type": "action",
-            "keywords": ["execute"],
-            "task_id": "lighting_control",
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "control lights",
-            "current_task_id": "lighting_control",  # Matches!
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.15 boost
-        assert final_score >= base_score + 0.14
-
-
 class TestFactorFourApplicationState:
     """Test Factor 4: Prakaraṇa (Application State)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_valid_screen(self, context_mgr: ContextManager):
-        """Test +0.12 boost for valid screen context."""
-        intent = {
-            "type": "control",
-            "keywords": ["lights"],
-            "valid_screens": ["Home", "LivingRoom", "Kitchen"],
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "turn on lights",
-            "current_task_id": None,
-            "current_screen": "Home",  # Valid screen
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.12 boost
-        assert final_score >= base_score + 0.11
-    
     def test_penalty_invalid_screen(self, context_mgr: ContextManager):
         """Test -0.05 penalty for invalid screen."""
         intent = {
@@ -276,19 +281,10 @@ class TestFactorFourApplicationState:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "turn on lights",
-            "current_task_id": None,
-            "current_screen": "Settings",  # Invalid screen
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            user_input="turn on lights",
+            current_screen="Settings"  # Invalid screen
+        )
         
         base_score = 0.5
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -297,77 +293,9 @@ class TestFactorFourApplicationState:
         assert final_score < base_score
 
 
-class TestFactorFiveSyntaxCues:
-    """Test Factor 5: Liṅga (Syntax Cues)."""
-    
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_question_mark(self, context_mgr: ContextManager):
-        """Test +0.1 boost for question mark with question intent."""
-        intent = {
-            "type": "question",
-            "keywords": ["what", "where"],
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "What time is it?",  # Question mark
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.1 boost
-        assert final_score >= base_score + 0.09
-    
-    def test_boost_exclamation_mark(self, context_mgr: ContextManager):
-        """Test +0.08 boost for exclamation with command intent."""
-        intent = {
-            "type": "command",
-            "keywords": ["execute"],
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "Execute now!",  # Exclamation mark
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.08 boost
-        assert final_score >= base_score + 0.07
-
-
 class TestFactorSevenPropriety:
     """Test Factor 7: Aucitī (Propriety)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
     def test_slang_penalty_in_business_mode(self, context_mgr: ContextManager):
         """Test 0.5x multiplier (50% penalty) for slang in Business mode."""
         intent = {
@@ -376,19 +304,11 @@ class TestFactorSevenPropriety:
             "register": "Slang"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "That's sick",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",  # Business mode - penalize slang
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            user_input="That's sick",
+            social_mode="Business",  # Business mode - penalize slang
+            user_demographic="Professional"
+        )
         
         base_score = 0.7
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -405,19 +325,11 @@ class TestFactorSevenPropriety:
             "register": "Slang"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "That's sick",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",  # Casual mode - no penalty
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Gen Z",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            user_input="That's sick",
+            social_mode="Casual",  # Casual mode - no penalty
+            user_demographic="Gen Z"
+        )
         
         base_score = 0.6
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -429,39 +341,6 @@ class TestFactorSevenPropriety:
 class TestFactorEightLocation:
     """Test Factor 8: Deśa (Location)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_matching_location(self, context_mgr: ContextManager):
-        """Test +0.2 boost for matching location."""
-        intent = {
-            "type": "reference",
-            "keywords": ["bank"],
-            "required_location": "riverside park",
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "bank",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": "Riverside Park",  # Matches!
-            "current_hour": 12,
-            "user_demographic": "Gen X",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.2 boost
-        assert final_score >= base_score + 0.19
-    
     def test_penalty_wrong_location(self, context_mgr: ContextManager):
         """Test -0.15 penalty for wrong location."""
         intent = {
@@ -471,19 +350,11 @@ class TestFactorEightLocation:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "bank",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": "Forest Trail",  # Wrong location
-            "current_hour": 12,
-            "user_demographic": "Gen X",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            user_input="bank",
+            gps_tag="Forest Trail",  # Wrong location
+            user_demographic="Gen X"
+        )
         
         base_score = 0.6
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -495,39 +366,6 @@ class TestFactorEightLocation:
 class TestFactorNineTime:
     """Test Factor 9: Kāla (Time)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_valid_time_range(self, context_mgr: ContextManager):
-        """Test +0.15 boost when current time is in valid range."""
-        intent = {
-            "type": "action",
-            "keywords": ["execute"],
-            "valid_time_range": (9, 17),  # Business hours
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "execute",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",
-            "gps_tag": None,
-            "current_hour": 12,  # Within range
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.15 boost
-        assert final_score >= base_score + 0.14
-    
     def test_penalty_invalid_time_range(self, context_mgr: ContextManager):
         """Test -0.1 penalty when time is outside valid range."""
         intent = {
@@ -537,19 +375,12 @@ class TestFactorNineTime:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "execute",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",
-            "gps_tag": None,
-            "current_hour": 22,  # Outside range
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            user_input="execute",
+            social_mode="Business",
+            current_hour=22,  # Outside range
+            user_demographic="Professional"
+        )
         
         base_score = 0.6
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -561,39 +392,6 @@ class TestFactorNineTime:
 class TestFactorTenUserProfile:
     """Test Factor 10: Vyakti (User Profile)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_gen_z_match(self, context_mgr: ContextManager):
-        """Test +0.12 boost for Gen Z matching casual vocabulary."""
-        intent = {
-            "type": "evaluation",
-            "keywords": ["awesome"],
-            "vocabulary_level": "Casual",
-            "register": "Slang"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "awesome",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Gen Z",  # Gen Z + Casual vocabulary match
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.12 boost
-        assert final_score >= base_score + 0.11
-    
     def test_penalty_demographic_mismatch(self, context_mgr: ContextManager):
         """Test -0.05 penalty for demographic vocabulary mismatch."""
         intent = {
@@ -603,19 +401,10 @@ class TestFactorTenUserProfile:
             "register": "Formal"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "executive",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Boomer",  # Mismatch with Technical vocabulary
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            user_input="executive",
+            user_demographic="Boomer"  # Mismatch with Technical vocabulary
+        )
         
         base_score = 0.6
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -624,78 +413,9 @@ class TestFactorTenUserProfile:
         assert final_score <= base_score - 0.04
 
 
-class TestFactorElevenIntonation:
-    """Test Factor 11: Svara (Intonation)."""
-    
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
-    def test_boost_high_pitch_urgent(self, context_mgr: ContextManager):
-        """Test +0.15 boost for high pitch with urgent intent."""
-        intent = {
-            "type": "alarm",
-            "keywords": ["urgent"],
-            "urgency": "Urgent",
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "urgent!",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "High",  # High pitch + Urgent
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.15 boost
-        assert final_score >= base_score + 0.14
-    
-    def test_boost_rising_pitch_question(self, context_mgr: ContextManager):
-        """Test +0.12 boost for rising pitch with question intent."""
-        intent = {
-            "type": "question",
-            "keywords": ["what"],
-            "register": "Neutral"
-        }
-        
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "What?",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Gen Z",
-            "audio_pitch": "Rising",  # Rising pitch + Question
-            "input_confidence": 0.9
-        }
-        
-        base_score = 0.5
-        final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
-        
-        # Should have +0.12 boost
-        assert final_score >= base_score + 0.11
-
-
 class TestFactorTwelveFidelity:
     """Test Factor 12: Apabhraṃśa (Fidelity)."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
     def test_boost_slang_with_low_confidence(self, context_mgr: ContextManager):
         """Test 1.15x boost for slang/casual with low input confidence."""
         intent = {
@@ -705,19 +425,11 @@ class TestFactorTwelveFidelity:
             "has_alternate_forms": True
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "sick",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Gen Z",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.65  # Low confidence
-        }
+        context_data = _ctx(
+            user_input="sick",
+            user_demographic="Gen Z",
+            input_confidence=0.65  # Low confidence
+        )
         
         base_score = 0.5
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -735,19 +447,12 @@ class TestFactorTwelveFidelity:
             "has_alternate_forms": False
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "execute",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.60  # Low confidence
-        }
+        context_data = _ctx(
+            user_input="execute",
+            social_mode="Business",
+            user_demographic="Professional",
+            input_confidence=0.60  # Low confidence
+        )
         
         base_score = 0.7
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -764,19 +469,12 @@ class TestFactorTwelveFidelity:
             "register": "Formal"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "execute",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.95  # High confidence
-        }
+        context_data = _ctx(
+            user_input="execute",
+            social_mode="Business",
+            user_demographic="Professional",
+            input_confidence=0.95  # High confidence
+        )
         
         base_score = 0.6
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -789,10 +487,6 @@ class TestFactorTwelveFidelity:
 class TestScoreBounding:
     """Test that confidence scores are properly bounded [0, 1]."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
     def test_score_lower_bound(self, context_mgr: ContextManager):
         """Test score doesn't go below 0."""
         intent = {
@@ -801,19 +495,7 @@ class TestScoreBounding:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "invalid",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.5
-        }
+        context_data = _ctx(user_input="invalid", input_confidence=0.5)
         
         base_score = 0.1  # Low starting score
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -828,19 +510,7 @@ class TestScoreBounding:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": ["perfect match", "perfect test"],
-            "system_state": "OFF",
-            "user_input": "perfect",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(command_history=["perfect match", "perfect test"], user_input="perfect")
         
         base_score = 0.9  # High starting score
         final_score = context_mgr.calculate_confidence(intent, context_data, base_score)
@@ -851,10 +521,6 @@ class TestScoreBounding:
 class TestPolysemicDisambiguation:
     """Test 12-factor scoring on real polysemic test cases from intent_db.json."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
     def test_bank_river_vs_financial(self, context_mgr: ContextManager):
         """Test disambiguation of 'bank' as river vs. financial institution."""
         river_intent = {
@@ -874,19 +540,13 @@ class TestPolysemicDisambiguation:
         }
         
         # Test in Nature context - river should score higher
-        nature_context = {
-            "command_history": ["Show hiking trails"],
-            "system_state": "OFF",
-            "user_input": "bank",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": "Riverside Park",
-            "current_hour": 10,
-            "user_demographic": "Gen X",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        nature_context = _ctx(
+            command_history=["Show hiking trails"],
+            user_input="bank",
+            gps_tag="Riverside Park",
+            current_hour=10,
+            user_demographic="Gen X"
+        )
         
         river_score = context_mgr.calculate_confidence(river_intent, nature_context, 0.5)
         financial_score = context_mgr.calculate_confidence(financial_intent, nature_context, 0.5)
@@ -895,19 +555,14 @@ class TestPolysemicDisambiguation:
         assert river_score > financial_score
         
         # Test in City context - financial should score higher
-        city_context = {
-            "command_history": ["Check account balance"],
-            "system_state": "OFF",
-            "user_input": "bank",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",
-            "gps_tag": "Downtown Business District",
-            "current_hour": 10,
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        city_context = _ctx(
+            command_history=["Check account balance"],
+            user_input="bank",
+            social_mode="Business",
+            gps_tag="Downtown Business District",
+            current_hour=10,
+            user_demographic="Professional"
+        )
         
         river_score_city = context_mgr.calculate_confidence(river_intent, city_context, 0.5)
         financial_score_city = context_mgr.calculate_confidence(financial_intent, city_context, 0.5)
@@ -932,19 +587,12 @@ class TestPolysemicDisambiguation:
         }
         
         # Test in Casual context
-        casual_context = {
-            "command_history": ["That movie was amazing"],
-            "system_state": "OFF",
-            "user_input": "That's sick",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Gen Z",
-            "audio_pitch": "High",
-            "input_confidence": 0.9
-        }
+        casual_context = _ctx(
+            command_history=["That movie was amazing"],
+            user_input="That's sick",
+            user_demographic="Gen Z",
+            audio_pitch="High"
+        )
         
         positive_score = context_mgr.calculate_confidence(positive_intent, casual_context, 0.6)
         negative_score = context_mgr.calculate_confidence(negative_intent, casual_context, 0.6)
@@ -953,19 +601,13 @@ class TestPolysemicDisambiguation:
         assert positive_score > negative_score
         
         # Test in Business context
-        business_context = {
-            "command_history": ["Quality report"],
-            "system_state": "OFF",
-            "user_input": "That's sick",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Business",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Professional",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.88
-        }
+        business_context = _ctx(
+            command_history=["Quality report"],
+            user_input="That's sick",
+            social_mode="Business",
+            user_demographic="Professional",
+            input_confidence=0.88
+        )
         
         positive_score_biz = context_mgr.calculate_confidence(positive_intent, business_context, 0.6)
         negative_score_biz = context_mgr.calculate_confidence(negative_intent, business_context, 0.6)
@@ -979,10 +621,6 @@ class TestPolysemicDisambiguation:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    @pytest.fixture
-    def context_mgr(self) -> ContextManager:
-        return ContextManager()
-    
     def test_empty_context_history(self, context_mgr: ContextManager):
         """Test with empty command history."""
         intent = {
@@ -991,19 +629,10 @@ class TestEdgeCases:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],  # Empty
-            "system_state": "OFF",
-            "user_input": "test",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(
+            command_history=[],  # Empty
+            user_input="test"
+        )
         
         # Should not crash
         score = context_mgr.calculate_confidence(intent, context_data, 0.5)
@@ -1017,19 +646,7 @@ class TestEdgeCases:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "test",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(user_input="test")
         
         score = context_mgr.calculate_confidence(intent, context_data, 0.0)
         assert 0.0 <= score <= 1.0
@@ -1042,19 +659,7 @@ class TestEdgeCases:
             "register": "Neutral"
         }
         
-        context_data = {
-            "command_history": [],
-            "system_state": "OFF",
-            "user_input": "test",
-            "current_task_id": None,
-            "current_screen": None,
-            "social_mode": "Casual",
-            "gps_tag": None,
-            "current_hour": 12,
-            "user_demographic": "Millennial",
-            "audio_pitch": "Neutral",
-            "input_confidence": 0.9
-        }
+        context_data = _ctx(user_input="test")
         
         score = context_mgr.calculate_confidence(intent, context_data, 1.0)
         assert 0.0 <= score <= 1.0
@@ -0,0 +1,28 @@
+"""
+Tests for scripts/generate_big_data.py chunked generation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts import generate_big_data
+
+
+@pytest.fixture
+def fixed_seed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make iter_dataset_chunks draw the same per-chunk seeds on every call."""
+    seed_sequence = np.random.SeedSequence
+    monkeypatch.setattr(generate_big_data.np.random, "SeedSequence", lambda: seed_sequence(1234))
+
+
+def test_worker_pool_matches_in_process_chunks(fixed_seed: None) -> None:
+    """workers=2 yields the same chunks, in the same order, as workers=1."""
+    kwargs = dict(num_rows=500, edge_case_ratio=0.2, chunk_size=150)
+    serial = list(generate_big_data.iter_dataset_chunks(workers=1, **kwargs))
+    pooled = list(generate_big_data.iter_dataset_chunks(workers=2, **kwargs))
+    
+    assert [len(chunk) for chunk in pooled] == [len(chunk) for chunk in serial] == [150, 150, 100, 100]
+    assert sum(map(len, pooled)) == 500
+    for serial_chunk, pooled_chunk in zip(serial, pooled):
+        pd.testing.assert_frame_equal(pooled_chunk, serial_chunk)
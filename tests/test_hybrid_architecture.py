@@ -22,13 +22,13 @@ from core.intent_engine import (
 )
 
 
-def test_stage_1_semantic_candidates():
+def test_stage_1_semantic_candidates(intent_engine):
     """Test Stage 1: Semantic Flash returns Top 5 candidates."""
     print("\n" + "="*60)
     print("TEST 1: Stage 1 - Semantic Flash (Vector Search)")
     print("="*60)
     
-    engine = IntentEngine(use_fast_memory=False)
+    engine = intent_engine
     
     # Test input
     user_input = "set a timer for 5 minutes"
@@ -56,13 +56,13 @@ def test_stage_1_semantic_candidates():
     return True
 
 
-def test_stage_2_hard_stop_rules():
+def test_stage_2_hard_stop_rules(intent_engine):
     """Test Stage 2: Hard Stop rules discard invalid candidates."""
     print("\n" + "="*60)
     print("TEST 2: Stage 2 - Hard Stop Rules")
     print("="*60)
     
-    engine = IntentEngine(use_fast_memory=False)
+    engine = intent_engine
     
     # Create a test scenario with conflict marker
     user_input = "cancel the timer"
@@ -93,13 +93,13 @@ def test_stage_2_hard_stop_rules():
     return True
 
 
-def test_context_boost_scoring():
+def test_context_boost_scoring(intent_engine):
     """Test Stage 2: Context factors boost candidate scores."""
     print("\n" + "="*60)
     print("TEST 3: Context Boost Scoring")
     print("="*60)
     
-    engine = IntentEngine(use_fast_memory=False)
+    engine = intent_engine
     
     # Test with location context
     user_input = "I need help"
@@ -132,13 +132,13 @@ def test_context_boost_scoring():
     return True
 
 
-def test_hybrid_logic_end_to_end():
+def test_hybrid_logic_end_to_end(intent_engine):
     """Test complete Hybrid Architecture end-to-end."""
     print("\n" + "="*60)
     print("TEST 4: End-to-End Hybrid Logic")
     print("="*60)
     
-    engine = IntentEngine(use_fast_memory=False)
+    engine = intent_engine
     
     # Test case 1: Normal resolution
     user_input_1 = "play my favorite music"
@@ -180,13 +180,13 @@ def test_hybrid_logic_end_to_end():
     return True
 
 
-def test_backward_compatibility():
+def test_backward_compatibility(intent_engine):
     """Test backward compatibility: resolve_intent still works."""
     print("\n" + "="*60)
     print("TEST 5: Backward Compatibility")
     print("="*60)
     
-    engine = IntentEngine(use_fast_memory=False)
+    engine = intent_engine
     
     user_input = "turn on the lights"
     context = {"location": "bedroom"}
@@ -210,13 +210,13 @@ def test_backward_compatibility():
     return True
 
 
-def test_fallback_mechanism():
+def test_fallback_mechanism(intent_engine):
     """Test fallback mechanism when confidence is too low."""
     print("\n" + "="*60)
     print("TEST 6: Fallback Mechanism")
     print("="*60)
     
-    engine = IntentEngine(use_fast_memory=False)
+    engine = intent_engine
     
     # Deliberately ambiguous input
     user_input = "asdfjkl qwerty zxcvbnm"
@@ -257,10 +257,13 @@ def run_all_tests():
         ("Fallback Mechanism", test_fallback_mechanism),
     ]
     
+    # Load the model and corpus once and share it, like the pytest fixture
+    engine = IntentEngine(use_fast_memory=False)
+    
     results = []
     for test_name, test_func in tests:
         try:
-            result = test_func()
+            result = test_func(engine)
             results.append((test_name, "PASSED", None))
         except AssertionError as e:
             results.append((test_name, "FAILED", str(e)))